@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, status, HTTPException, Query, UploadFile, File
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.admin import (
     AdminCreateUserRequest,
     AdminUserResponse,
@@ -8,23 +8,36 @@ from app.schemas.admin import (
     AdminUpdateUserRequest,
     AdminUpdateCycleRequest,
     AdminListUsersResponse,
+    AdminImportUserError,
+    AdminImportUsersResponse,
     AnalyticsResponse,  # Import the new schema
+    DatabasePoolResponse,
+    AdminRoleResponse,
+    AdminRolesResponse,
 )
-from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import (
+from app.core.database import (
+    get_db,
+    get_pool_stats,
+    prefer_replica,
+    AsyncSessionLocal,
+    ReplicaSessionLocal,
+)
+from app.core.cache import analytics_cache
+from app.repositories.async_impl import (
     UserRepository,
-    RoleRepository,
+    TokenVersionRepository,
     ApplicationRepository,
     ApplicationCycleRepository,
 )
 from app.core.security import (
-    hash_password,
-    verify_password,
-    create_access_token,
+    hash_password_async,
+    hash_passwords_async,
+    verify_password_async,
+    create_user_access_token,
     create_refresh_token,
-    require_token_type,
 )
-from app.api.deps import admin_required
+from app.api.deps import admin_required, get_roles
+from app.core.roles import ADMIN, RoleRegistry, load_role_registry
 from app.domain.entities import User, ApplicationCycle
 from app.schemas.auth import TokenResponse
 from app.schemas.base import APIResponse
@@ -36,39 +49,69 @@ from app.core.utils import (
     raise_internal_error,
 )
 from app.schemas.auth import LoginRequest
+from app.core.pagination import decode_cursor, next_cursor
+from app.core.user_import import batched, detect_format, iter_rows
+from app.core.config import settings
+from pydantic import ValidationError as PydanticValidationError
+from starlette.concurrency import run_in_threadpool
+import os
 import uuid
+from typing import Optional
 from datetime import datetime, timezone
-from fastapi.security import HTTPAuthorizationCredentials
 from app.api.auth import bearer_scheme
 
 
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
-
-
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get(
     "/analytics/",
     response_model=APIResponse[AnalyticsResponse],
-    dependencies=[Depends(bearer_scheme)],
+    dependencies=[Depends(bearer_scheme), Depends(prefer_replica)],
 )
-def get_analytics(
+async def get_analytics(
+    cycle_id: Optional[int] = Query(
+        None, description="Limit the figures to one application cycle"
+    ),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
+
+    def read_primary() -> bool:
+        # A write just cleared this entry and the replica may not have it
+        # yet; reloading from there would cache the old figures for a TTL
+        return ReplicaSessionLocal is not None and analytics_cache.invalidated_within(
+            cycle_id, settings.DB_REPLICA_PIN_SECONDS
+        )
+
+    async def load():
+        if not read_primary():
+            return await build_analytics(db, cycle_id)
+        async with AsyncSessionLocal() as primary_db:
+            return await build_analytics(primary_db, cycle_id)
+
+    async def refresh():
+        # Runs after this request has finished, so it can't use its session
+        session_factory = AsyncSessionLocal if read_primary() else ReplicaSessionLocal
+        async with (session_factory or AsyncSessionLocal)() as refresh_db:
+            return await build_analytics(refresh_db, cycle_id)
+
+    response_data = await analytics_cache.get_or_load(cycle_id, load, refresh=refresh)
+    return APIResponse(
+        data=response_data, message="Analytics data retrieved successfully."
+    )
+
+
+async def build_analytics(db: AsyncSession, cycle_id: Optional[int] = None):
     app_repo = ApplicationRepository(db)
 
-    total_applicants = app_repo.count_all()
+    # Totals, funnel and distributions come from the counters table
+    analytics = await app_repo.get_analytics_summary(cycle_id=cycle_id)
+    total_applicants = analytics.total
 
     # Handle case with no applications to avoid division by zero
     if total_applicants == 0:
-        response_data = AnalyticsResponse(
+        return AnalyticsResponse(
             total_applicants=0,
             acceptance_rate=0.0,
             average_review_time_days=0.0,
@@ -76,41 +119,67 @@ def get_analytics(
             school_distribution={},
             country_distribution={},
         )
-        return APIResponse(
-            data=response_data, message="Analytics data retrieved successfully."
-        )
 
     # Acceptance Rate
-    accepted_count = app_repo.count_by_status("accepted")
+    accepted_count = analytics.status_counts.get("accepted", 0)
     acceptance_rate = (accepted_count / total_applicants) * 100
 
-    # Average Review Time
-    avg_review_time_days = app_repo.get_average_review_time()
-
-    # Application Funnel
-    status_dist = app_repo.get_status_distribution()
-    application_funnel = {status: count for status, count in status_dist}
-
-    # School Distribution
-    school_dist = app_repo.get_school_distribution()
-    school_distribution = {school: count for school, count in school_dist}
-
-    # Country Distribution
-    country_dist = app_repo.get_country_distribution()
-    country_distribution = {country: count for country, count in country_dist}
+    # Average Review Time and its distribution
+    seconds_per_day = 24 * 60 * 60
+    avg_review_time_days = (analytics.average_review_seconds or 0.0) / seconds_per_day
+    review_time_percentiles_days = {
+        name: round(seconds / seconds_per_day, 2)
+        for name, seconds in analytics.review_seconds_percentiles.items()
+    }
 
-    response_data = AnalyticsResponse(
+    return AnalyticsResponse(
         total_applicants=total_applicants,
         acceptance_rate=round(acceptance_rate, 2),
         average_review_time_days=round(avg_review_time_days, 2),
-        application_funnel=application_funnel,
-        school_distribution=school_distribution,
-        country_distribution=country_distribution,
+        review_time_percentiles_days=review_time_percentiles_days,
+        application_funnel=analytics.status_counts,
+        school_distribution=analytics.school_counts,
+        country_distribution=analytics.country_counts,
     )
 
-    return APIResponse(
-        data=response_data, message="Analytics data retrieved successfully."
+
+@router.get(
+    "/db-pool/",
+    response_model=APIResponse[DatabasePoolResponse],
+    dependencies=[Depends(bearer_scheme)],
+)
+async def get_db_pool_stats(
+    current_user=Depends(admin_required),
+):
+    """
+    Reports connection pool usage for the worker that serves the request.
+    Each uvicorn worker has its own pools, so poll repeatedly (or scrape
+    /metrics) to see every worker.
+    """
+    response_data = DatabasePoolResponse(worker_pid=os.getpid(), pools=get_pool_stats())
+    return APIResponse(data=response_data, message="Pool stats retrieved successfully.")
+
+
+@router.post(
+    "/roles/reload/",
+    response_model=APIResponse[AdminRolesResponse],
+    dependencies=[Depends(bearer_scheme)],
+)
+async def reload_roles(
+    current_user=Depends(admin_required),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Re-reads the roles table into the role registry. Like the pool stats,
+    this only affects the worker that serves the request; restart the
+    workers (or call this once per worker) after changing roles.
+    """
+    registry = await load_role_registry(db)
+    response_data = AdminRolesResponse(
+        worker_pid=os.getpid(),
+        roles=[AdminRoleResponse(id=r.id, name=r.name) for r in registry.list_all()],
     )
+    return APIResponse(data=response_data, message="Roles reloaded.")
 
 
 @router.get(
@@ -118,32 +187,28 @@ def get_analytics(
     response_model=APIResponse[AdminUserResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def get_user_by_id(
+async def get_user_by_id(
     user_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
-    get_access_token_payload(credentials)
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
 
     try:
         user_uuid = uuid.UUID(user_id)
     except ValueError:
         raise_validation_error("Invalid user ID format.")
 
-    user = user_repo.get_by_id(user_uuid)
+    user = await user_repo.get_by_id(user_uuid)
     if not user:
         raise_not_found("User not found.", "user")
-    role = role_repo.get_by_id(user.role_id) if user.role_id else None
-    role_name = role.name if role else ""
 
     response_data = AdminUserResponse(
         id=str(user.id),
         full_name=user.full_name,
         email=user.email,
-        role=role_name,
+        role=roles.name_of(user.role_id),
         is_active=user.is_active,
     )
 
@@ -151,23 +216,25 @@ def get_user_by_id(
 
 
 @router.post("/login/", response_model=APIResponse[TokenResponse])
-def admin_login(data: LoginRequest, db: Session = Depends(get_db)):
+async def admin_login(
+    data: LoginRequest,
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
     email = data.email
     password = data.password
     if not email or not password:
         raise_validation_error("Email and password required.")
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
-    user = user_repo.get_by_email(email)
-    if not user or not verify_password(password, user.password):
+    user = await user_repo.get_by_email(email)
+    if not user or not await verify_password_async(password, user.password):
         raise_forbidden("Incorrect email or password.")
-    if user.role_id != 4:  # Only allow admin login
+    if roles.name_of(user.role_id) != ADMIN:  # Only allow admin login
         raise_forbidden("Admin access required.")
-    access = create_access_token({"sub": str(user.id)})
+    version = await TokenVersionRepository(db).get(user.id)
+    access = create_user_access_token(user, ADMIN, version)
     refresh = create_refresh_token({"sub": str(user.id)})
-    role = role_repo.get_by_id(user.role_id) if user.role_id else None
-    role_name = role.name if role else ""
-    response_data = TokenResponse(access=access, refresh=refresh, role=role_name)
+    response_data = TokenResponse(access=access, refresh=refresh, role=ADMIN)
     return APIResponse(data=response_data, message="Login successful.")
 
 
@@ -177,30 +244,28 @@ def admin_login(data: LoginRequest, db: Session = Depends(get_db)):
     status_code=201,
     dependencies=[Depends(bearer_scheme)],
 )
-def create_user(
+async def create_user(
     data: AdminCreateUserRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
-    get_access_token_payload(credentials)
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
-    if user_repo.get_by_email(data.email):
+    if await user_repo.get_by_email(data.email):
         raise_conflict("Email already registered.")
-    role = role_repo.get_by_name(data.role)
+    role = roles.get_by_name(data.role)
     if not role:
         raise_not_found("Role not found.", "role")
     user = User(
         id=uuid.uuid4(),
         email=data.email,
-        password=hash_password(data.password),
+        password=await hash_password_async(data.password),
         full_name=data.full_name,
         role_id=role.id,
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
-    created = user_repo.create(user)
+    created = await user_repo.create(user)
     response_data = AdminUserResponse(
         id=str(created.id),
         full_name=created.full_name,
@@ -213,45 +278,140 @@ def create_user(
     return APIResponse(data=response_data, message="User created successfully.")
 
 
+@router.post(
+    "/users/import/",
+    response_model=APIResponse[AdminImportUsersResponse],
+    dependencies=[Depends(bearer_scheme)],
+)
+async def import_users(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(
+        None, description="csv or ndjson; detected from the file name if omitted"
+    ),
+    current_user=Depends(admin_required),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    """
+    Creates users from a CSV (with a header row) or NDJSON upload with the
+    same fields as POST /admin/users/. Valid rows are created; every other
+    row is reported back with its line number and the reason.
+    """
+    fmt = detect_format(format, file.filename, file.content_type)
+    user_repo = UserRepository(db)
+
+    errors = []
+    created_count = 0
+    seen = set()
+    batches = batched(iter_rows(file.file, fmt), settings.USER_IMPORT_BATCH_SIZE)
+    # Reading and parsing the spooled upload is blocking file I/O; each batch
+    # is pulled in the threadpool so the event loop keeps serving requests
+    while batch := await run_in_threadpool(next, batches, None):
+        valid = []
+        for row, record in batch:
+            if isinstance(record, str):
+                errors.append(AdminImportUserError(row=row, error=record))
+                continue
+            try:
+                data = AdminCreateUserRequest.model_validate(record)
+            except PydanticValidationError as e:
+                first = e.errors()[0]
+                field = ".".join(str(part) for part in first["loc"])
+                errors.append(
+                    AdminImportUserError(
+                        row=row,
+                        email=record.get("email") or None,
+                        error=f"{field}: {first['msg']}",
+                    )
+                )
+                continue
+            if roles.get_by_name(data.role) is None:
+                error = "Role not found."
+            elif data.email in seen:
+                error = "Duplicate email in file."
+            else:
+                seen.add(data.email)
+                valid.append((row, data))
+                continue
+            errors.append(AdminImportUserError(row=row, email=data.email, error=error))
+
+        registered = await user_repo.existing_emails([data.email for _, data in valid])
+        new = [(row, data) for row, data in valid if data.email not in registered]
+        hashes = await hash_passwords_async([data.password for _, data in new])
+        now = datetime.now(timezone.utc)
+        inserted = await user_repo.bulk_create(
+            [
+                User(
+                    id=uuid.uuid4(),
+                    email=data.email,
+                    password=hashed,
+                    full_name=data.full_name,
+                    role_id=roles.id_of(data.role),
+                    created_at=now,
+                    updated_at=now,
+                )
+                for (_, data), hashed in zip(new, hashes)
+            ]
+        )
+        created_count += len(inserted)
+        errors.extend(
+            AdminImportUserError(
+                row=row, email=data.email, error="Email already registered."
+            )
+            for row, data in valid
+            if data.email not in inserted
+        )
+
+    errors.sort(key=lambda e: e.row)
+    response_data = AdminImportUsersResponse(
+        created_count=created_count, error_count=len(errors), errors=errors
+    )
+    return APIResponse(data=response_data, message="Users imported.")
+
+
 @router.get(
     "/users/",
     response_model=APIResponse[AdminListUsersResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def list_users(
+async def list_users(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     limit: int = Query(
         10, ge=1, le=100, description="Number of users per page (max 100)"
     ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; takes precedence over page"
+    ),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
-    get_access_token_payload(credentials)
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
-    offset = (page - 1) * limit
-    users = user_repo.list_all(offset=offset, limit=limit)
-    roles = {r.id: r.name for r in role_repo.list_all()}
+    if cursor:
+        users = await user_repo.list_after(decode_cursor(cursor), limit)
+    else:
+        offset = (page - 1) * limit
+        users = await user_repo.list_all(offset=offset, limit=limit)
 
     response_items = [
         AdminUserResponse(
             id=str(u.id),
             full_name=u.full_name,
             email=u.email,
-            role=roles.get(u.role_id, ""),
+            role=roles.name_of(u.role_id),
             is_active=u.is_active,
         )
         for u in users
     ]
 
     # Get total count for pagination
-    total_count = user_repo.count_all()
+    total_count = await user_repo.count_all()
     response_data = AdminListUsersResponse(
         users=response_items,
         total_count=total_count,
         page=page,
         limit=limit,
+        next_cursor=next_cursor(users, limit, lambda u: (u.created_at, u.id)),
     )
 
     return APIResponse(data=response_data, message="Users retrieved successfully.")
@@ -262,16 +422,14 @@ def list_users(
     response_model=APIResponse[AdminUserResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def update_user(
+async def update_user(
     user_id: str,
     data: AdminUpdateUserRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
-    get_access_token_payload(credentials)
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
     try:
         user_uuid = uuid.UUID(user_id)
     except ValueError:
@@ -283,9 +441,9 @@ def update_user(
     if data.email is not None:
         update_data["email"] = data.email
     if data.password is not None:
-        update_data["password"] = hash_password(data.password)
+        update_data["password"] = await hash_password_async(data.password)
     if data.role is not None:
-        role = role_repo.get_by_name(data.role)
+        role = roles.get_by_name(data.role)
         if not role:
             raise_not_found("Role not found.", "role")
         update_data["role_id"] = role.id
@@ -293,18 +451,15 @@ def update_user(
     if data.is_active is not None:
         update_data["is_active"] = 1 if data.is_active else 0
 
-    updated = user_repo.update(user_uuid, **update_data)
+    updated = await user_repo.update(user_uuid, **update_data)
     if not updated:
         raise_not_found("User not found.", "user")
 
-    role = role_repo.get_by_id(updated.role_id) if updated.role_id else None
-    role_name = role.name if role else ""
-
     response_data = AdminUserResponse(
         id=str(updated.id),
         full_name=updated.full_name,
         email=updated.email,
-        role=role_name,
+        role=roles.name_of(updated.role_id),
         profile_picture=updated.profile_picture_url,
         is_active=(updated.is_active == 1 if updated.is_active is not None else False),
     )
@@ -317,19 +472,17 @@ def update_user(
     response_model=APIResponse[AdminUserResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def delete_user(
+async def delete_user(
     user_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     user_repo = UserRepository(db)
     try:
         user_uuid = uuid.UUID(user_id)
     except ValueError:
         raise_validation_error("Invalid user ID format.")
-    deleted = user_repo.delete(user_uuid)
+    deleted = await user_repo.delete(user_uuid)
     if not deleted:
         raise_not_found("User not found.", "user")
     return APIResponse(message="User deleted successfully.")
@@ -341,15 +494,13 @@ def delete_user(
     status_code=201,
     dependencies=[Depends(bearer_scheme)],
 )
-def create_cycle(
+async def create_cycle(
     data: AdminCycleCreateRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     cycle_repo = ApplicationCycleRepository(db)
-    if cycle_repo.get_by_name(data.name):
+    if await cycle_repo.get_by_name(data.name):
         raise_conflict("Cycle with this name already exists.")
     if data.start_date >= data.end_date:
         raise_validation_error("Start date must be before end date.")
@@ -362,7 +513,7 @@ def create_cycle(
         created_at=datetime.now(timezone.utc),
         description=data.description if data.description else None,
     )
-    created = cycle_repo.create(cycle)
+    created = await cycle_repo.create(cycle)
     response_data = AdminCycleResponse(
         id=created.id,
         name=created.name,
@@ -380,15 +531,13 @@ def create_cycle(
     response_model=APIResponse[AdminCycleResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def activate_cycle(
+async def activate_cycle(
     cycle_id: int,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     cycle_repo = ApplicationCycleRepository(db)
-    activated = cycle_repo.activate(cycle_id)
+    activated = await cycle_repo.activate(cycle_id)
     if not activated:
         raise_not_found("Cycle not found.", "cycle")
     return APIResponse(data=activated, message=f"Cycle {activated.name} is now active.")
@@ -399,27 +548,25 @@ def activate_cycle(
     response_model=APIResponse[AdminCycleResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def update_cycle(
+async def update_cycle(
     cycle_id: int,
     data: AdminUpdateCycleRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     cycle_repo = ApplicationCycleRepository(db)
-    existing_cycle = cycle_repo.get_by_id(cycle_id)
+    existing_cycle = await cycle_repo.get_by_id(cycle_id)
     if not existing_cycle:
         raise_not_found("Cycle not found.", "cycle")
     if data.name is not None:
-        cycle_with_name = cycle_repo.get_by_name(data.name)
+        cycle_with_name = await cycle_repo.get_by_name(data.name)
         if cycle_with_name and cycle_with_name.id != cycle_id:
             raise_conflict("Cycle with this name already exists.")
     if data.start_date is not None and data.end_date is not None:
         if data.start_date >= data.end_date:
             raise_validation_error("Start date must be before end date.")
     update_data = {k: v for k, v in data.dict().items() if v is not None}
-    updated = cycle_repo.update(cycle_id, **update_data)
+    updated = await cycle_repo.update(cycle_id, **update_data)
     if not updated:
         raise_not_found("Cycle not found.", "cycle")
     response_data = AdminCycleResponse(
@@ -439,15 +586,13 @@ def update_cycle(
     response_model=APIResponse[AdminCycleResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def delete_cycle(
+async def delete_cycle(
     cycle_id: int,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     cycle_repo = ApplicationCycleRepository(db)
-    deleted = cycle_repo.delete(cycle_id)
+    deleted = await cycle_repo.delete(cycle_id)
     if not deleted:
         raise_not_found("Cycle not found.", "cycle")
     return APIResponse(message="Cycle deleted successfully.")
@@ -458,15 +603,13 @@ def delete_cycle(
     response_model=APIResponse[AdminCycleResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def deactivate_cycle(
+async def deactivate_cycle(
     cycle_id: int,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     current_user=Depends(admin_required),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     cycle_repo = ApplicationCycleRepository(db)
-    deactivated = cycle_repo.deactivate(cycle_id)
+    deactivated = await cycle_repo.deactivate(cycle_id)
     if not deactivated:
         raise_not_found("Cycle not found.", "cycle")
     return APIResponse(
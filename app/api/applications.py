@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.application import (
     ApplicationResponse,
     ApplicationStatusResponse,
 )
 from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import (
+from app.repositories.async_impl import (
     ApplicationRepository,
     ApplicationCycleRepository,
 )
@@ -24,11 +24,10 @@ import os
 from datetime import datetime
 import cloudinary.uploader
 import shutil
+from starlette.concurrency import run_in_threadpool
 
 # Import bearer_scheme from auth.py
 from app.api.auth import bearer_scheme
-from app.core.security import require_token_type
-from fastapi.security import HTTPAuthorizationCredentials
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -36,11 +35,9 @@ UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
-# Helper to extract and validate access token from credentials
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
+def _save_upload(upload: UploadFile, path: str):
+    with open(path, "wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
 
 
 @router.post(
@@ -49,7 +46,7 @@ def get_access_token_payload(
     status_code=201,
     dependencies=[Depends(bearer_scheme)],
 )
-def create_application(
+async def create_application(
     school: str = Form(...),
     student_id: str = Form(...),
     country: str = Form(...),
@@ -60,18 +57,15 @@ def create_application(
     essay_about_you: str = Form(...),
     resume: UploadFile = File(...),
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
     cycle_repo = ApplicationCycleRepository(db)
-    active_cycle = cycle_repo.get_active()
+    active_cycle = await cycle_repo.get_active()
     if not active_cycle:
         raise_validation_error("No active application cycle found.")
 
-    existing_application = app_repo.get_by_applicant_id(current_user.id)
-    if existing_application:
+    if await app_repo.exists_for_applicant(current_user.id):
         raise_conflict("You have already submitted an application.")
 
     if not resume.filename.endswith(".pdf"):
@@ -80,9 +74,9 @@ def create_application(
     temp_file_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}_{resume.filename}")
 
     try:
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(resume.file, buffer)
-        result = cloudinary.uploader.upload(
+        await run_in_threadpool(_save_upload, resume, temp_file_path)
+        result = await run_in_threadpool(
+            cloudinary.uploader.upload,
             temp_file_path,
             resource_type="raw",
             folder="resumes",
@@ -113,7 +107,7 @@ def create_application(
         submitted_at=None,
         updated_at=datetime.utcnow(),
     )
-    app = app_repo.create(application)
+    app = await app_repo.create(application)
 
     response_data = ApplicationResponse(
         id=str(app.id),
@@ -143,14 +137,12 @@ def create_application(
     response_model=APIResponse[ApplicationStatusResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def get_my_status(
+async def get_my_status(
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
-    app = app_repo.get_by_applicant_id(current_user.id)
+    app = await app_repo.get_summary_by_applicant(current_user.id)
     if not app:
         raise_not_found("No application found.", "application")
     response_data = ApplicationStatusResponse(
@@ -173,16 +165,14 @@ def get_my_status(
     response_model=APIResponse[ApplicationResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def get_application(
+async def get_application(
     application_id: str,
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
     try:
-        app = app_repo.get_by_id(uuid.UUID(application_id))
+        app = await app_repo.get_by_id(uuid.UUID(application_id))
     except ValueError:
         raise_validation_error("Invalid application ID.")
     if not app:
@@ -216,11 +206,10 @@ def get_application(
     response_model=APIResponse[ApplicationResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def update_application(
+async def update_application(
     application_id: str,
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
     school: str = Form(None),
     student_id: str = Form(None),
     country: str = Form(None),
@@ -230,9 +219,8 @@ def update_application(
     essay_about_you: str = Form(None),
     resume: UploadFile = File(None),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
-    app = app_repo.get_by_id(uuid.UUID(application_id))
+    app = await app_repo.get_by_id(uuid.UUID(application_id))
     if not app:
         raise_not_found("Application not found.", "application")
     if app.applicant_id != current_user.id:
@@ -260,9 +248,9 @@ def update_application(
             raise_validation_error("Resume must be a PDF file.")
         temp_file_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}_{resume.filename}")
         try:
-            with open(temp_file_path, "wb") as buffer:
-                shutil.copyfileobj(resume.file, buffer)
-            result = cloudinary.uploader.upload(
+            await run_in_threadpool(_save_upload, resume, temp_file_path)
+            result = await run_in_threadpool(
+                cloudinary.uploader.upload,
                 temp_file_path,
                 resource_type="raw",
                 folder="resumes",
@@ -275,7 +263,7 @@ def update_application(
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
 
-    app_repo.update(app)
+    await app_repo.update(app)
     response_data = ApplicationResponse(
         id=str(app.id),
         status=app.status,
@@ -304,22 +292,20 @@ def update_application(
     response_model=APIResponse[ApplicationResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def delete_application(
+async def delete_application(
     application_id: str,
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
-    app = app_repo.get_by_id(uuid.UUID(application_id))
+    app = await app_repo.get_summary(uuid.UUID(application_id))
     if not app:
         raise_not_found("Application not found.", "application")
     if app.applicant_id != current_user.id:
         raise_forbidden("You are not authorized to delete this application.")
     if app.status != "in_progress":
         raise_conflict("You can only delete your application before it is submitted.")
-    app_repo.delete(app.id)
+    await app_repo.delete(app.id)
     return APIResponse(
         data=None,
         message="Application deleted successfully",
@@ -332,15 +318,13 @@ def delete_application(
     response_model=APIResponse[ApplicationResponse],
     dependencies=[Depends(bearer_scheme)],
 )
-def submit_application(
+async def submit_application(
     application_id: str,
     current_user=Depends(applicant_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
-    app = app_repo.get_by_id(uuid.UUID(application_id))
+    app = await app_repo.get_by_id(uuid.UUID(application_id))
     if not app:
         raise_not_found("Application not found.", "application")
     if app.applicant_id != current_user.id:
@@ -349,7 +333,7 @@ def submit_application(
         raise_conflict("You have already submitted your application.")
     app.status = "submitted"
     app.submitted_at = datetime.utcnow()
-    app_repo.update(app)
+    await app_repo.update(app)
     response_data = ApplicationResponse(
         id=str(app.id),
         status=app.status,
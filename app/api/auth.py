@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.auth import (
     RegisterRequest,
@@ -18,14 +18,16 @@ from app.schemas.auth import (
 from app.schemas.base import APIResponse
 
 from app.domain.entities import User as UserEntity
-from app.repositories.sqlalchemy_impl import RoleRepository, UserRepository
+from app.repositories.async_impl import TokenVersionRepository, UserRepository
+
+from app.api.deps import get_roles
+from app.core.roles import APPLICANT, RoleRegistry
 
 from app.core.database import get_db
-from app.models.role import Role as RoleModel
 from app.core.security import (
-    hash_password,
-    verify_password,
-    create_access_token,
+    hash_password_async,
+    verify_password_async,
+    create_user_access_token,
     require_token_type,
     create_refresh_token,
     create_password_reset_token,  # New Import
@@ -49,24 +51,28 @@ bearer_scheme = HTTPBearer()
     response_model=APIResponse[RegisterResponse],
     status_code=status.HTTP_201_CREATED,
 )
-def register(data: RegisterRequest, db: Session = Depends(get_db)):
+async def register(
+    data: RegisterRequest,
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
     # ... existing register code ...
     user_repo = UserRepository(db)
-    if user_repo.get_by_email(data.email):
+    if await user_repo.get_by_email(data.email):
         raise_conflict("An account with this email already exists.")
-    role = db.query(RoleModel).filter(RoleModel.name == "applicant").first()
+    role = roles.get_by_name(APPLICANT)
     if not role:
         raise_internal_error("Server configuration error: 'applicant' role not found.")
     user_to_create = UserEntity(
         id=uuid.uuid4(),
         email=data.email,
-        password=hash_password(data.password),
+        password=await hash_password_async(data.password),
         full_name=data.full_name,
         role_id=role.id,
         created_at=datetime.datetime.utcnow(),
         updated_at=datetime.datetime.utcnow(),
     )
-    created_user = user_repo.create(user_to_create)
+    created_user = await user_repo.create(user_to_create)
     response_data = RegisterResponse(
         id=str(created_user.id),
         full_name=created_user.full_name,
@@ -79,38 +85,40 @@ def register(data: RegisterRequest, db: Session = Depends(get_db)):
     "/token/",
     response_model=APIResponse[TokenResponse],
 )
-def login(data: LoginRequest, db: Session = Depends(get_db)):
+async def login(
+    data: LoginRequest,
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
     # ... existing login code ...
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
-    user = user_repo.get_by_email(data.email)
-    if not user or not verify_password(data.password, user.password):
+    user = await user_repo.get_by_email(data.email)
+    if not user or not await verify_password_async(data.password, user.password):
         raise_unauthorized("Incorrect email or password.")
-    role = role_repo.get_by_id(user.role_id)
-    access_token = create_access_token({"sub": str(user.id)})
+    role = roles.name_of(user.role_id)
+    version = await TokenVersionRepository(db).get(user.id)
+    access_token = create_user_access_token(user, role, version)
     refresh_token = create_refresh_token({"sub": str(user.id)})
-    response_data = TokenResponse(
-        access=access_token, refresh=refresh_token, role=role.name
-    )
+    response_data = TokenResponse(access=access_token, refresh=refresh_token, role=role)
     return APIResponse(data=response_data, message="Login successful.")
 
 
 # --- NEW FORGOT PASSWORD ENDPOINT ---
 @router.post("/forgot-password/", response_model=APIResponse)
-async def forgot_password(data: ForgotPasswordRequest, db: Session = Depends(get_db)):
+async def forgot_password(data: ForgotPasswordRequest, db: AsyncSession = Depends(get_db)):
     """
     Handles the request to reset a password.
     Sends a reset link to the user's email if the account exists.
     """
     user_repo = UserRepository(db)
-    user = user_repo.get_by_email(data.email)
+    user = await user_repo.get_by_email(data.email)
 
     # To prevent email enumeration attacks, always return a success response.
     # The email is only sent if the user actually exists.
     if user:
         reset_token = create_password_reset_token({"sub": str(user.id)})
         await send_password_reset_email(
-            email_to=user.email, callback_url=data.callback_url, token=reset_token
+            db, email_to=user.email, callback_url=data.callback_url, token=reset_token
         )
 
     return APIResponse(
@@ -120,7 +128,7 @@ async def forgot_password(data: ForgotPasswordRequest, db: Session = Depends(get
 
 # --- NEW RESET PASSWORD ENDPOINT ---
 @router.post("/reset-password/", response_model=APIResponse)
-def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def reset_password(data: ResetPasswordRequest, db: AsyncSession = Depends(get_db)):
     """
     Resets the user's password using a valid token.
     """
@@ -133,14 +141,14 @@ def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
         raise_unauthorized("Invalid token payload.")
 
     user_repo = UserRepository(db)
-    user = user_repo.get_by_id(user_uuid)
+    user = await user_repo.get_by_id(user_uuid)
 
     if not user:
         raise_not_found("User not found.", "user")
 
     # Update the user's password
-    hashed_new_password = hash_password(data.new_password)
-    updated_user = user_repo.update(user_uuid, password=hashed_new_password)
+    hashed_new_password = await hash_password_async(data.new_password)
+    updated_user = await user_repo.update(user_uuid, password=hashed_new_password)
 
     if not updated_user:
         raise_internal_error("Failed to update password.")
@@ -152,13 +160,27 @@ def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
     "/token/refresh/",
     response_model=APIResponse[AccessTokenResponse],
 )
-def refresh_token(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+async def refresh_token(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
     # ... existing refresh token code ...
     payload = require_token_type(credentials.credentials, "refresh")
     if payload is None or "sub" not in payload:
         raise_unauthorized("Invalid or expired token.")
-    user_id = payload["sub"]
-    new_access_token = create_access_token({"sub": user_id})
+    try:
+        user_uuid = uuid.UUID(payload["sub"])
+    except ValueError:
+        raise_unauthorized("Invalid or expired token.")
+    # The new token's claims must reflect the user as they are now
+    user = await UserRepository(db).get_by_id(user_uuid)
+    if not user:
+        raise_unauthorized("Invalid or expired token.")
+    version = await TokenVersionRepository(db).get(user.id)
+    new_access_token = create_user_access_token(
+        user, roles.name_of(user.role_id), version
+    )
     response_data = AccessTokenResponse(access=new_access_token)
     return APIResponse(
         data=response_data, message="Access token refreshed successfully."
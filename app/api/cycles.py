@@ -1,35 +1,35 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import ApplicationCycleRepository
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, prefer_replica
+from app.repositories.async_impl import ApplicationCycleRepository
 from app.schemas.cycle import PublicCycleResponse, PublicCycleListResponse
 from app.schemas.base import APIResponse
-from app.api.auth import bearer_scheme
-from app.core.security import require_token_type
-from fastapi.security import HTTPAuthorizationCredentials
+from app.core.pagination import decode_cursor, next_cursor
 
 router = APIRouter(prefix="/cycles", tags=["cycles"])
 
 
-# Helper to extract and validate access token from credentials
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
-
-
-@router.get("/", response_model=APIResponse[PublicCycleListResponse])
-def get_all_cycles(
-    db: Session = Depends(get_db),
+@router.get(
+    "/",
+    response_model=APIResponse[PublicCycleListResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def get_all_cycles(
+    db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; takes precedence over page"
+    ),
 ):
     repo = ApplicationCycleRepository(db)
-    offset = (page - 1) * limit
-    cycles = repo.list_all(offset=offset, limit=limit)
-    total_count = (
-        repo.count_all() if hasattr(repo, "count_all") else len(repo.list_all())
-    )
+    if cursor:
+        cycles = await repo.list_after(decode_cursor(cursor, id_type=int), limit)
+    else:
+        offset = (page - 1) * limit
+        cycles = await repo.list_all(offset=offset, limit=limit)
+    total_count = await repo.count_all()
     response_data = PublicCycleListResponse(
         cycles=[
             PublicCycleResponse(
@@ -46,17 +46,22 @@ def get_all_cycles(
         total_count=total_count,
         page=page,
         limit=limit,
+        next_cursor=next_cursor(cycles, limit, lambda c: (c.created_at, c.id)),
     )
     return APIResponse(data=response_data, message="Cycles retrieved successfully.")
 
 
-@router.get("/active/", response_model=APIResponse[PublicCycleListResponse])
-def get_active_cycles(db: Session = Depends(get_db)):
+@router.get(
+    "/active/",
+    response_model=APIResponse[PublicCycleListResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def get_active_cycles(db: AsyncSession = Depends(get_db)):
     """
     Retrieves all active application cycles.
     """
     repo = ApplicationCycleRepository(db)
-    active_cycles = repo.list_all(is_active=True)
+    active_cycles = await repo.list_all(is_active=True)
     if not active_cycles:
         return APIResponse(
             data=PublicCycleListResponse(cycles=[], total_count=0, page=1, limit=10),
@@ -86,10 +91,14 @@ def get_active_cycles(db: Session = Depends(get_db)):
     )
 
 
-@router.get("/{cycle_id}/", response_model=APIResponse[PublicCycleResponse])
-def get_cycle_by_id(cycle_id: int, db: Session = Depends(get_db)):
+@router.get(
+    "/{cycle_id}/",
+    response_model=APIResponse[PublicCycleResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def get_cycle_by_id(cycle_id: int, db: AsyncSession = Depends(get_db)):
     repo = ApplicationCycleRepository(db)
-    c = repo.get_by_id(cycle_id)
+    c = await repo.get_by_id(cycle_id)
     if not c:
         raise HTTPException(status_code=404, detail="Cycle not found.")
     response_data = PublicCycleResponse(
@@ -1,69 +1,125 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
-from sqlalchemy.orm import Session
-from app.core.security import decode_token, require_token_type
-from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import UserRepository
-from app.models.user import User as UserModel
-from app.domain.entities import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Mapping
+from app.core.security import verify_access_token
+from app.core.database import get_db, pin_to_primary
+from app.core.unit_of_work import after_commit
+from app.core.cache import principal_cache
+from app.core.token_versions import token_versions
+from app.core.roles import (
+    APPLICANT,
+    REVIEWER,
+    MANAGER,
+    ADMIN,
+    RoleRegistry,
+    get_role_registry,
+)
+from app.repositories.async_impl import TokenVersionRepository, UserRepository
+from app.domain.entities import Principal
 import uuid
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token/")
 
 
-# Dependency to get current user from JWT token
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> User:
+# Verified claims of the request's access token. FastAPI resolves a
+# dependency once per request, so every guard and handler that depends on
+# this shares one decode; handlers that need the claims depend on it too.
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> Mapping[str, Any]:
+    return verify_access_token(token)
+
+
+# Role registry, loaded at startup (or by the first request that needs it)
+async def get_roles(db: AsyncSession = Depends(get_db)) -> RoleRegistry:
+    return await get_role_registry(db)
+
+
+# Dependency to get current user from JWT token. The principal comes from
+# the token's claims, or from the cache for tokens issued without them;
+# handlers that need the full user row load it themselves.
+async def get_current_user(
+    claims: Mapping[str, Any] = Depends(get_token_claims),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    payload = require_token_type(token, "access")
-    if payload is None or "sub" not in payload:
+    if "sub" not in claims:
         raise credentials_exception
-    user_id = payload["sub"]
+    user_id = claims["sub"]
     try:
         user_uuid = uuid.UUID(user_id)
     except Exception:
         raise credentials_exception
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(user_uuid)
-    if user is None:
-        raise credentials_exception
+
+    if "ver" in claims:
+        # Only revocation needs checking: role and status are in the token
+        await token_versions.refresh_if_stale(
+            lambda: TokenVersionRepository(db).get_all()
+        )
+        if not token_versions.is_current(user_uuid, claims["ver"]):
+            raise credentials_exception
+        user = Principal(
+            id=user_uuid,
+            role_id=roles.id_of(claims.get("role")),
+            is_active=claims.get("active", True),
+        )
+    else:
+        # Tokens issued before the role claims were added only carry `sub`
+        user_repo = UserRepository(db)
+        user = await principal_cache.get_or_load(
+            user_uuid, lambda: user_repo.get_principal(user_uuid)
+        )
+        if user is None:
+            raise credentials_exception
+
+    # Deactivated users keep their role; every guard starts from here
+    if not user.is_active:
+        raise HTTPException(status_code=403, detail="This account is inactive.")
+
+    # If this request writes, the user reads the primary for a while after
+    # it commits, so they see their own changes (see get_db)
+    after_commit(db, lambda: pin_to_primary(user_id))
     return user
 
 
 # Applicant RBAC guard
-def applicant_required(current_user: User = Depends(get_current_user)):
-    # Assume role_id 1 is Applicant, or check by role name if needed
-    if current_user.role_id != 1:
+async def applicant_required(
+    current_user: Principal = Depends(get_current_user),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    if roles.name_of(current_user.role_id) != APPLICANT:
         raise HTTPException(status_code=403, detail="Applicant access required.")
     return current_user
 
 
-def admin_required(current_user: User = Depends(get_current_user)):
-    # Check by role_id or fetch role name if needed
-    if current_user.role_id != 4:  # Adjust if your admin role_id is different
+async def admin_required(
+    current_user: Principal = Depends(get_current_user),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    if roles.name_of(current_user.role_id) != ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required.")
     return current_user
 
 
-def reviewer_required(current_user: User = Depends(get_current_user)):
-    if (
-        current_user.role_id != 2
-        and current_user.role_id != 4
-        and current_user.role_id != 3
-    ):
+async def reviewer_required(
+    current_user: Principal = Depends(get_current_user),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    if roles.name_of(current_user.role_id) not in (REVIEWER, MANAGER, ADMIN):
         raise HTTPException(
             status_code=403, detail="Reviewer, Manager or Admin access required."
         )
     return current_user
 
 
-def manager_required(current_user: User = Depends(get_current_user)):
-    if current_user.role_id != 3 and current_user.role_id != 4:
+async def manager_required(
+    current_user: Principal = Depends(get_current_user),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    if roles.name_of(current_user.role_id) not in (MANAGER, ADMIN):
         raise HTTPException(status_code=403, detail="Manager or Admin access required.")
     return current_user
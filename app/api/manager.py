@@ -1,25 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel
-from app.domain.entities import User
-from sqlalchemy.orm import Session
-from app.models.user import User as UserModel
-from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import (
+from pydantic import BaseModel, Field
+from app.domain.entities import Principal
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from app.core.database import get_db, prefer_replica, request_session_factory
+from app.core.export import EXPORT_FORMATS, encode_rows
+from app.repositories.async_impl import (
+    FINAL_STATUSES,
     ApplicationRepository,
     ApplicationCycleRepository,
     UserRepository,
 )
-from app.models.application import Application as ApplicationModel
 from app.schemas.application import ApplicationResponse
 from app.api.auth import bearer_scheme
-from app.core.security import require_token_type
-from fastapi.security import HTTPAuthorizationCredentials
 from app.schemas.base import APIResponse
-from app.api.deps import manager_required
+from app.core.pagination import decode_cursor, next_cursor
+from app.api.deps import manager_required, get_roles
+from app.core.roles import REVIEWER, RoleRegistry
 import logging
-from app.repositories.sqlalchemy_impl import ReviewRepository
+from app.repositories.async_impl import ReviewRepository
 from app.schemas.review import ReviewDetail
 from pydantic import BaseModel
 from typing import Optional
@@ -34,13 +35,6 @@ router = APIRouter(
 )
 
 
-# Helper to extract and validate access token from credentials
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
-
-
 # Response model for GET /manager/applications/
 class ApplicationSummary(BaseModel):
     id: UUID
@@ -54,6 +48,7 @@ class ApplicationListResponse(BaseModel):
     total_count: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class ReviewerSummary(BaseModel):
@@ -68,21 +63,24 @@ class ReviewerListResponse(BaseModel):
 
 
 # GET /manager/applications/available-reviewers/
-@router.get("/available-reviewers/", response_model=APIResponse[ReviewerListResponse])
-def get_available_reviewers(
+@router.get(
+    "/available-reviewers/",
+    response_model=APIResponse[ReviewerListResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def get_available_reviewers(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(manager_required),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
-    reviewers = (
-        db.query(UserModel)
-        .filter(UserModel.role_id == 2)
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
+    user_repo = UserRepository(db)
+    reviewer_role_id = roles.id_of(REVIEWER)
+    reviewers = await user_repo.list_by_role(
+        reviewer_role_id, offset=(page - 1) * limit, limit=limit
     )
-    total_count = db.query(UserModel).filter(UserModel.role_id == 2).count()
+    total_count = await user_repo.count_by_role(reviewer_role_id)
     reviewer_list = [
         ReviewerSummary(id=r.id, full_name=r.full_name, email=r.email)
         for r in reviewers
@@ -109,19 +107,68 @@ class DecideRequest(BaseModel):
     decision_notes: Optional[str]
 
 
+class BulkDecideRequest(BaseModel):
+    status: str  # 'accepted' or 'rejected'
+    decision_notes: Optional[str] = None
+    # Either the applications to decide, on their own...
+    application_ids: Optional[List[UUID]] = None
+    # ...or every undecided one in a cycle (the active one by default)
+    # whose review scores add up to at least min_score
+    cycle_id: Optional[int] = None
+    min_score: Optional[float] = None
+
+
+class BulkDecideResult(BaseModel):
+    application_id: UUID
+    # 'decided', 'already_decided', 'not_eligible' (still in progress) or
+    # 'not_found'; only 'decided' applications were changed
+    result: str
+    previous_status: Optional[str] = None
+
+
+class BulkDecideResponse(BaseModel):
+    status: str
+    decided_count: int
+    results: List[BulkDecideResult]
+
+
+class AutoAssignRequest(BaseModel):
+    cycle_id: Optional[int] = None  # Defaults to the active cycle
+    status: Optional[str] = None  # Only assign applications in this status
+    reviewer_ids: List[UUID] = Field(..., min_length=1)
+
+
+class ReviewerAssignment(BaseModel):
+    reviewer_id: UUID
+    assigned_count: int
+    open_load: int  # Undecided applications assigned, including this run
+
+
+class AutoAssignResponse(BaseModel):
+    cycle_id: int
+    assigned_count: int
+    reviewers: List[ReviewerAssignment]
+
+
 # GET /manager/applications/
-@router.get("/", response_model=APIResponse[ApplicationListResponse])
-def list_applications(
+@router.get(
+    "/",
+    response_model=APIResponse[ApplicationListResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def list_applications(
     status: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(manager_required),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; takes precedence over page"
+    ),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
 ):
     app_repo = ApplicationRepository(db)
     cycle_repo = ApplicationCycleRepository(db)
-    user_repo = UserRepository(db)
-    active_cycle = cycle_repo.get_active()
+    active_cycle = await cycle_repo.get_active()
     if not active_cycle:
         return APIResponse(
             data=ApplicationListResponse(
@@ -130,42 +177,85 @@ def list_applications(
             message="No active cycle found",
         )
 
-    # Query all applications for the active cycle, optionally filter by status
-    query = db.query(ApplicationModel).filter(
-        ApplicationModel.cycle_id == active_cycle.id
-    )
-    if status:
-        query = query.filter(ApplicationModel.status == status)
-
     # Get total count for pagination
-    total_count = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * limit
-    apps = query.offset(offset).limit(limit).all()
-
-    results = []
-    for app in apps:
-        applicant = user_repo.get_by_id(app.applicant_id)
-        reviewer_name = None
-        if app.assigned_reviewer_id:
-            reviewer = user_repo.get_by_id(app.assigned_reviewer_id)
-            reviewer_name = reviewer.full_name if reviewer else None
-        results.append(
-            ApplicationSummary(
-                id=app.id,
-                applicant_name=applicant.full_name if applicant else "",
-                status=app.status,
-                assigned_reviewer_name=reviewer_name,
-            )
+    total_count = await app_repo.count_by_cycle(active_cycle.id, status=status)
+
+    # Applicant and reviewer names are resolved in the same query
+    if cursor:
+        summaries = await app_repo.list_summaries_after(
+            active_cycle.id, decode_cursor(cursor), limit, status=status
+        )
+    else:
+        offset = (page - 1) * limit
+        summaries = await app_repo.list_summaries(
+            active_cycle.id, status=status, offset=offset, limit=limit
         )
 
+    results = [
+        ApplicationSummary(
+            id=summary.id,
+            applicant_name=summary.applicant_name,
+            status=summary.status,
+            assigned_reviewer_name=summary.assigned_reviewer_name,
+        )
+        for summary in summaries
+    ]
+
     response_data = ApplicationListResponse(
-        applications=results, total_count=total_count, page=page, limit=limit
+        applications=results,
+        total_count=total_count,
+        page=page,
+        limit=limit,
+        next_cursor=next_cursor(summaries, limit, lambda a: (a.submitted_at, a.id)),
     )
     return APIResponse(data=response_data, message="Applications fetched successfully")
 
 
+# GET /manager/applications/export/
+@router.get(
+    "/export/",
+    response_class=StreamingResponse,
+    dependencies=[Depends(prefer_replica)],
+)
+async def export_applications(
+    request: Request,
+    cycle_id: Optional[int] = Query(None, description="Defaults to the active cycle"),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Streams every application in a cycle, with its review scores, as CSV
+    or NDJSON. Rows are read and sent in batches, so memory use does not
+    depend on the size of the cycle.
+    """
+    cycle_repo = ApplicationCycleRepository(db)
+    if cycle_id is not None:
+        cycle = await cycle_repo.get_by_id(cycle_id)
+    else:
+        cycle = await cycle_repo.get_active()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Cycle not found")
+
+    # The request's session is closed before the response body is sent, so
+    # the export reads through a session of its own, from the same database
+    # get_db chose: the primary while the manager's recent writes are pinned
+    session_factory = request_session_factory(request)
+
+    async def body():
+        async with session_factory() as session:
+            columns, rows = await ApplicationRepository(session).stream_export(cycle.id)
+            async for chunk in encode_rows(format, columns, rows):
+                yield chunk
+
+    filename = f"cycle-{cycle.id}-applications.{format}"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 class ApplicationResponseWithName(BaseModel):
     id: UUID
     status: str
@@ -191,24 +281,24 @@ class ApplicationWithReviewResponse(BaseModel):
 @router.get(
     "/{application_id}/", response_model=APIResponse[ApplicationWithReviewResponse]
 )
-def get_application(
+async def get_application(
     application_id: UUID,
-    current_user: User = Depends(manager_required),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
 ):
     app_repo = ApplicationRepository(db)
     review_repo = ReviewRepository(db)
     user_repo = UserRepository(db)
-    application = app_repo.get_by_id(application_id)
+    application = await app_repo.get_by_id(application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    applicant = user_repo.get_by_id(application.applicant_id)
+    applicant = await user_repo.get_by_id(application.applicant_id)
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
 
     # Try to get the review for this application
-    review = review_repo.get_by_application_id(application_id)
+    review = await review_repo.get_by_application_id(application_id)
     review_detail = None
     if review:
         review_detail = ReviewDetail(
@@ -248,13 +338,148 @@ def get_application(
     return APIResponse(data=response_data, message="Application fetched successfully")
 
 
+# POST /manager/applications/auto-assign/
+@router.post("/auto-assign/", response_model=APIResponse[AutoAssignResponse])
+async def auto_assign_reviewers(
+    req: AutoAssignRequest,
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
+):
+    """
+    Spreads a cycle's submitted, unassigned applications across a pool of
+    reviewers, giving each application to whoever has the fewest undecided
+    ones. Applications still in progress are left alone.
+    """
+    app_repo = ApplicationRepository(db)
+    cycle_repo = ApplicationCycleRepository(db)
+    user_repo = UserRepository(db)
+
+    if req.cycle_id is not None:
+        cycle = await cycle_repo.get_by_id(req.cycle_id)
+    else:
+        cycle = await cycle_repo.get_active()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Cycle not found")
+
+    reviewer_ids = list(dict.fromkeys(req.reviewer_ids))
+    reviewers = await user_repo.active_ids_with_role(
+        reviewer_ids, roles.id_of(REVIEWER)
+    )
+    unknown = [str(r) for r in reviewer_ids if r not in reviewers]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Not active reviewers: {', '.join(unknown)}",
+        )
+
+    assignments, load = await app_repo.auto_assign_reviewers(
+        cycle.id, reviewer_ids, status=req.status
+    )
+    logging.info(
+        f"Auto-assigned {sum(map(len, assignments.values()))} applications in "
+        f"cycle {cycle.id} across {len(reviewer_ids)} reviewers"
+    )
+
+    results = [
+        ReviewerAssignment(
+            reviewer_id=reviewer_id,
+            assigned_count=len(assignments[reviewer_id]),
+            open_load=load[reviewer_id] + len(assignments[reviewer_id]),
+        )
+        for reviewer_id in reviewer_ids
+    ]
+    response_data = AutoAssignResponse(
+        cycle_id=cycle.id,
+        assigned_count=sum(r.assigned_count for r in results),
+        reviewers=results,
+    )
+    return APIResponse(data=response_data, message="Reviewers assigned successfully.")
+
+
+# POST /manager/applications/bulk-decide/
+@router.post("/bulk-decide/", response_model=APIResponse[BulkDecideResponse])
+async def bulk_decide_applications(
+    req: BulkDecideRequest,
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
+):
+    """Records the same decision for a list of applications, or for a score cut-off."""
+    if req.status not in ["accepted", "rejected"]:
+        raise HTTPException(
+            status_code=400, detail="Status must be 'accepted' or 'rejected'."
+        )
+    if req.application_ids is not None:
+        if req.min_score is not None or req.cycle_id is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="application_ids can't be combined with cycle_id or min_score.",
+            )
+    elif req.min_score is None:
+        raise HTTPException(
+            status_code=400, detail="Provide either application_ids or min_score."
+        )
+
+    app_repo = ApplicationRepository(db)
+    if req.application_ids is not None:
+        application_ids = list(dict.fromkeys(req.application_ids))
+        decided, skipped = await app_repo.bulk_finalize_decisions(
+            req.status, req.decision_notes, application_ids=application_ids
+        )
+        results = []
+        for application_id in application_ids:
+            if application_id in decided:
+                result, previous_status = "decided", decided[application_id]
+            elif application_id in skipped:
+                previous_status = skipped[application_id]
+                result = (
+                    "already_decided"
+                    if previous_status in FINAL_STATUSES
+                    else "not_eligible"
+                )
+            else:
+                result, previous_status = "not_found", None
+            results.append(
+                BulkDecideResult(
+                    application_id=application_id,
+                    result=result,
+                    previous_status=previous_status,
+                )
+            )
+    else:
+        cycle_repo = ApplicationCycleRepository(db)
+        if req.cycle_id is not None:
+            cycle = await cycle_repo.get_by_id(req.cycle_id)
+        else:
+            cycle = await cycle_repo.get_active()
+        if not cycle:
+            raise HTTPException(status_code=404, detail="Cycle not found")
+        decided, _ = await app_repo.bulk_finalize_decisions(
+            req.status, req.decision_notes, cycle_id=cycle.id, min_score=req.min_score
+        )
+        results = [
+            BulkDecideResult(
+                application_id=application_id,
+                result="decided",
+                previous_status=previous_status,
+            )
+            for application_id, previous_status in decided.items()
+        ]
+
+    logging.info(f"Bulk decision '{req.status}' recorded for {len(decided)} applications")
+    response_data = BulkDecideResponse(
+        status=req.status, decided_count=len(decided), results=results
+    )
+    return APIResponse(data=response_data, message="Decisions recorded successfully.")
+
+
 # PATCH /manager/applications/{application_id}/assign/
 @router.patch("/{application_id}/assign/", response_model=APIResponse[None])
-def assign_reviewer(
+async def assign_reviewer(
     application_id: UUID,
     req: AssignReviewerRequest,
-    current_user: User = Depends(manager_required),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
 ):
     logging.info(
         f"Assign Reviewer called with application_id={application_id}, reviewer_id={req.reviewer_id}"
@@ -263,20 +488,18 @@ def assign_reviewer(
     app_repo = ApplicationRepository(db)
     user_repo = UserRepository(db)
 
-    application = app_repo.get_by_id(application_id)
+    application = await app_repo.get_summary(application_id)
     if not application:
         logging.warning(f"Application with id {application_id} not found.")
         raise HTTPException(status_code=404, detail="Application not found")
 
-    reviewer = user_repo.get_by_id(req.reviewer_id)
+    reviewer = await user_repo.get_by_id(req.reviewer_id)
     if not reviewer:
         logging.warning(f"Reviewer with id {req.reviewer_id} not found.")
         raise HTTPException(status_code=404, detail="Reviewer not found")
 
     try:
-        application.assigned_reviewer_id = req.reviewer_id
-        application.status = "pending_review"
-        app_repo.update(application)
+        await app_repo.assign_reviewer(application_id, req.reviewer_id)
         logging.info(
             f"Reviewer {req.reviewer_id} assigned to application {application_id}"
         )
@@ -289,11 +512,11 @@ def assign_reviewer(
 
 # PATCH /manager/applications/{application_id}/decide/
 @router.patch("/{application_id}/decide/", response_model=APIResponse[None])
-def decide_application(
+async def decide_application(
     application_id: UUID,
     req: DecideRequest,
-    current_user: User = Depends(manager_required),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(manager_required),
+    db: AsyncSession = Depends(get_db),
 ):
     if req.status not in ["accepted", "rejected"]:
         raise HTTPException(
@@ -301,10 +524,9 @@ def decide_application(
         )
 
     app_repo = ApplicationRepository(db)
-    application = app_repo.get_by_id(application_id)
+    application = await app_repo.finalize_decision(
+        application_id, req.status, req.decision_notes
+    )
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    application.status = req.status
-    application.decision_notes = req.decision_notes
-    app_repo.update(application)
     return APIResponse(message="Decision recorded successfully.")
@@ -2,18 +2,22 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File,
 import os
 import uuid
 import cloudinary.uploader
-from sqlalchemy.orm import Session
-from app.api.deps import get_current_user
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_current_user, get_roles
 from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import UserRepository, RoleRepository
-from app.core.security import verify_password, hash_password, require_token_type
+from app.repositories.async_impl import UserRepository
+from app.core.roles import RoleRegistry
+from app.core.security import (
+    verify_password_async,
+    hash_password_async,
+)
 from app.schemas.auth import (
     ProfileResponse,
     ChangePasswordRequest,
 )
-from app.domain.entities import User
+from app.domain.entities import Principal
 from app.api.auth import bearer_scheme
-from fastapi.security import HTTPAuthorizationCredentials
 from app.schemas.base import APIResponse
 
 router = APIRouter(
@@ -23,21 +27,14 @@ router = APIRouter(
 )
 
 
-# Helper to extract and validate access token from credentials
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
-
-
 @router.get("/me", response_model=APIResponse[ProfileResponse])
-def get_profile(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+async def get_profile(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
     user_repo = UserRepository(db)
-    role_repo = RoleRepository(db)
-    user = user_repo.get_by_id(current_user.id)
-    role = role_repo.get_by_id(user.role_id)
+    user = await user_repo.get_by_id(current_user.id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
 
@@ -45,7 +42,7 @@ def get_profile(
         id=str(user.id),
         full_name=user.full_name,
         email=user.email,
-        role=role.name,
+        role=roles.name_of(user.role_id),
         profile_picture_url=user.profile_picture_url,
     )
 
@@ -58,8 +55,9 @@ async def update_profile(
     full_name: str = Form(None),
     email: str = Form(None),
     profile_picture: UploadFile = File(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    roles: RoleRegistry = Depends(get_roles),
 ):
     user_repo = UserRepository(db)
     update_data = {}
@@ -74,7 +72,8 @@ async def update_profile(
         with open(temp_file_path, "wb") as buffer:
             buffer.write(await profile_picture.read())
         try:
-            result = cloudinary.uploader.upload(
+            result = await run_in_threadpool(
+                cloudinary.uploader.upload,
                 temp_file_path,
                 resource_type="image",
                 folder="profile_pictures",
@@ -87,17 +86,15 @@ async def update_profile(
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
 
-    updated = user_repo.update(current_user.id, **update_data)
+    updated = await user_repo.update(current_user.id, **update_data)
     if not updated:
         raise HTTPException(status_code=404, detail="User not found.")
     
-    role_repo = RoleRepository(db)
-    role = role_repo.get_by_id(updated.role_id)
     response_data = ProfileResponse(
         id=str(updated.id),
         full_name=updated.full_name,
         email=updated.email,
-        role=role.name,
+        role=roles.name_of(updated.role_id),
         profile_picture_url=updated.profile_picture_url,
     )
     
@@ -105,18 +102,18 @@ async def update_profile(
 
 
 @router.patch("/me/change-password", response_model=APIResponse[None])
-def change_password(
+async def change_password(
     data: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     user_repo = UserRepository(db)
-    user = user_repo.get_by_id(current_user.id)
+    user = await user_repo.get_by_id(current_user.id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
-    if not verify_password(data.old_password, user.password):
+    if not await verify_password_async(data.old_password, user.password):
         raise HTTPException(status_code=400, detail="Old password is incorrect.")
-    user.password = hash_password(data.new_password)
-    user_repo.update(user.id, password=user.password)
+    user.password = await hash_password_async(data.new_password)
+    await user_repo.update(user.id, password=user.password)
 
     return APIResponse(data=None, message="Password changed successfully.")
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.repositories.sqlalchemy_impl import (
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, prefer_replica
+from app.repositories.async_impl import (
     ApplicationRepository,
     ReviewRepository,
     UserRepository,
@@ -9,10 +10,8 @@ from app.repositories.sqlalchemy_impl import (
 from app.schemas.base import APIResponse
 from app.schemas.review import ReviewListResponse
 from app.core.utils import raise_not_found, raise_forbidden, raise_validation_error
+from app.core.pagination import decode_cursor, next_cursor
 import uuid
-from app.core.security import require_token_type
-from fastapi.security import HTTPAuthorizationCredentials
-from app.api.auth import bearer_scheme
 from app.api.deps import reviewer_required
 from app.schemas.review import (
     AssignedApplicationSummary,
@@ -25,22 +24,20 @@ from app.schemas.review import (
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
 
-# Helper to extract and validate access token from credentials
-def get_access_token_payload(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-):
-    return require_token_type(credentials.credentials, "access")
-
-
-@router.get("/assigned/", response_model=APIResponse[ReviewListResponse])
-def list_assigned_applications(
+@router.get(
+    "/assigned/",
+    response_model=APIResponse[ReviewListResponse],
+    dependencies=[Depends(prefer_replica)],
+)
+async def list_assigned_applications(
     page: int = 1,
     limit: int = 10,
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; takes precedence over page"
+    ),
     current_user=Depends(reviewer_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
 
     # Validate pagination parameters
     if page < 1:
@@ -48,28 +45,31 @@ def list_assigned_applications(
     if limit < 1 or limit > 100:
         raise_validation_error("Limit must be between 1 and 100")
 
-    # Calculate offset
-    offset = (page - 1) * limit
-
     app_repo = ApplicationRepository(db)
-    user_repo = UserRepository(db)
-    apps = app_repo.list_by_reviewer(current_user.id, offset=offset, limit=limit)
-    summaries = []
-    for app in apps:
-        applicant = user_repo.get_by_id(app.applicant_id)
-        summaries.append(
-            AssignedApplicationSummary(
-                application_id=str(app.id),
-                applicant_name=applicant.full_name if applicant else "",
-                status=app.status,
-                submission_date=app.submitted_at,
-            )
+    if cursor:
+        apps = await app_repo.list_summaries_by_reviewer_after(
+            current_user.id, decode_cursor(cursor), limit
+        )
+    else:
+        offset = (page - 1) * limit
+        apps = await app_repo.list_summaries_by_reviewer(
+            current_user.id, offset=offset, limit=limit
+        )
+    summaries = [
+        AssignedApplicationSummary(
+            application_id=str(app.id),
+            applicant_name=app.applicant_name,
+            status=app.status,
+            submission_date=app.submitted_at,
         )
+        for app in apps
+    ]
     response_data = ReviewListResponse(
         reviews=summaries,
-        total_count=len(summaries),
+        total_count=await app_repo.count_by_reviewer(current_user.id),
         page=page,
         limit=limit,
+        next_cursor=next_cursor(apps, limit, lambda a: (a.submitted_at, a.id)),
     )
     return APIResponse(data=response_data, message="Assigned applications retrieved.")
 
@@ -77,25 +77,23 @@ def list_assigned_applications(
 @router.get(
     "/{application_id}/", response_model=APIResponse[ApplicationWithReview]
 )  # Changed response model
-def get_application_review(
+async def get_application_review(
     application_id: str,
     current_user=Depends(reviewer_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
     review_repo = ReviewRepository(db)
     user_repo = UserRepository(db)
     try:
-        app = app_repo.get_by_id(uuid.UUID(application_id))
+        app = await app_repo.get_by_id(uuid.UUID(application_id))
     except ValueError:
         raise_validation_error("Invalid application ID format")
     if not app:
         raise_not_found("Application not found", "application")
     if app.assigned_reviewer_id != current_user.id:
         raise_forbidden("Not assigned to this application")
-    applicant = user_repo.get_by_id(app.applicant_id)
+    applicant = await user_repo.get_by_id(app.applicant_id)
 
     # Create the FullApplication object with data from the 'app' object
     full_application = FullApplication(
@@ -115,7 +113,7 @@ def get_application_review(
         updated_at=app.updated_at,
     )
 
-    review = review_repo.get_by_application_id(app.id)
+    review = await review_repo.get_by_application_id(app.id)
     review_detail = None
     if review:
         review_detail = ReviewDetail(
@@ -144,25 +142,23 @@ def get_application_review(
 
 
 @router.put("/{application_id}/", response_model=APIResponse[ReviewDetail])
-def update_review(
+async def update_review(
     application_id: str,
     data: ReviewUpdateRequest,
     current_user=Depends(reviewer_required),
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
 ):
-    get_access_token_payload(credentials)
     app_repo = ApplicationRepository(db)
     review_repo = ReviewRepository(db)
     try:
-        app = app_repo.get_by_id(uuid.UUID(application_id))
+        app = await app_repo.get_summary(uuid.UUID(application_id))
     except ValueError:
         raise_validation_error("Invalid application ID format")
     if not app:
         raise_not_found("Application not found", "application")
     if app.assigned_reviewer_id != current_user.id:
         raise_forbidden("Not assigned to this application")
-    review = review_repo.create_or_update(
+    review = await review_repo.create_or_update(
         app.id, current_user.id, data.dict(exclude_unset=True)
     )
     review_detail = ReviewDetail(
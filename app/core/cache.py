@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+from app.core.config import settings
+from app.core.metrics import register_collector
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class TTLCache:
+    """
+    In-process cache with a time-to-live and stale-while-revalidate.
+
+    A fresh entry is returned as is. An entry past its TTL but within the
+    stale window is still returned immediately, and a single background
+    refresh is started for its key. Anything older, or missing, is loaded
+    inline by the caller.
+
+    Entries are per worker process; invalidate() only reaches the current
+    process, so other workers catch up when their TTL runs out.
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        # Bumped on invalidate so a refresh that started earlier can't
+        # store a result computed from pre-write data
+        self._generations: Dict[Hashable, int] = {}
+        self._invalidated_at: Dict[Hashable, float] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (value, time.monotonic())
+
+    def invalidate(self, *keys: Hashable):
+        now = time.monotonic()
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._invalidated_at[key] = now
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidated_within(self, key: Hashable, seconds: float) -> bool:
+        """Whether `key` was invalidated in this process in the last `seconds`."""
+        invalidated_at = self._invalidated_at.get(key)
+        return invalidated_at is not None and time.monotonic() - invalidated_at < seconds
+
+    def clear(self):
+        self.invalidate(*list(self._entries))
+
+    async def get_or_load(
+        self, key: Hashable, load: Loader, refresh: Optional[Loader] = None
+    ):
+        """
+        Returns the cached value for `key`, calling `load` on a miss.
+
+        `refresh` is what the background revalidation runs. It must not
+        depend on the current request (e.g. its database session), since it
+        outlives it; without one, stale entries count as misses.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if refresh is not None and age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._start_refresh(key, refresh)
+                return value
+
+        self.misses += 1
+        generation = self._generations.get(key, 0)
+        value = await load()
+        if self._generations.get(key, 0) == generation:
+            self.set(key, value)
+        return value
+
+    def _start_refresh(self, key: Hashable, refresh: Loader):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, refresh))
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: Hashable, refresh: Loader):
+        generation = self._generations.get(key, 0)
+        try:
+            value = await refresh()
+            if self._generations.get(key, 0) == generation:
+                self.set(key, value)
+            self.refreshes += 1
+        except Exception:
+            self.refresh_errors += 1
+            logger.exception("Background refresh of %s cache key %r failed", self.name, key)
+        finally:
+            self._refreshing.discard(key)
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits_total": self.hits,
+            "stale_hits_total": self.stale_hits,
+            "misses_total": self.misses,
+            "invalidations_total": self.invalidations,
+            "refreshes_total": self.refreshes,
+            "refresh_errors_total": self.refresh_errors,
+        }
+
+
+class LRUCache:
+    """
+    Bounded in-process cache: entries expire after `ttl` seconds (or their
+    own ttl, if set with one), and once `maxsize` is reached the least
+    recently used entry is evicted. None results are not cached. Like
+    TTLCache, entries are per worker process.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._generations: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: Hashable):
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        self.invalidate(*list(self._entries))
+
+    async def get_or_load(self, key: Hashable, load: Loader):
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        generation = self._generations.get(key, 0)
+        value = await load()
+        # An invalidation during the load means it may have read old data
+        if value is not None and self._generations.get(key, 0) == generation:
+            self.set(key, value)
+        return value
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits_total": self.hits,
+            "misses_total": self.misses,
+            "evictions_total": self.evictions,
+            "invalidations_total": self.invalidations,
+        }
+
+
+# /admin/analytics/ responses, keyed by cycle id (None for all cycles)
+analytics_cache = TTLCache(
+    "analytics",
+    ttl=settings.ANALYTICS_CACHE_TTL,
+    stale_ttl=settings.ANALYTICS_CACHE_STALE_TTL,
+)
+
+register_collector("cache", analytics_cache.snapshot, {"cache": "analytics"})
+
+# Authenticated principals for get_current_user, keyed by user id
+principal_cache = LRUCache(
+    "principal",
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+)
+
+register_collector("cache", principal_cache.snapshot, {"cache": "principal"})
+
+# Claims of access tokens whose signature has been checked, keyed by the
+# token itself; each entry expires with its token's exp
+token_cache = LRUCache(
+    "token",
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+register_collector("cache", token_cache.snapshot, {"cache": "token"})
@@ -17,6 +17,49 @@ class Settings(BaseSettings):
         os.getenv("PASSWORD_RESET_TOKEN_EXPIRE_MINUTES", 15)
     )
 
+    # Connection pool, applied per uvicorn worker
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() in (
+        "true",
+        "1",
+        "t",
+    )
+
+    # Optional read replica for GET endpoints that opt in. A user who writes
+    # is kept on the primary for DB_REPLICA_PIN_SECONDS so they read it back.
+    DATABASE_REPLICA_URL: str | None = os.getenv("DATABASE_REPLICA_URL") or None
+    DB_REPLICA_PIN_SECONDS: int = int(os.getenv("DB_REPLICA_PIN_SECONDS", 5))
+
+    # /admin/analytics/ cache: served fresh for ANALYTICS_CACHE_TTL seconds,
+    # then stale for up to ANALYTICS_CACHE_STALE_TTL more while it refreshes
+    ANALYTICS_CACHE_TTL: int = int(os.getenv("ANALYTICS_CACHE_TTL", 60))
+    ANALYTICS_CACHE_STALE_TTL: int = int(os.getenv("ANALYTICS_CACHE_STALE_TTL", 300))
+
+    # Authenticated principals cached per worker, by user id. Updates and
+    # deletes clear the entry in the worker that made them; other workers
+    # see the change within PRINCIPAL_CACHE_TTL seconds.
+    PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", 10000))
+    PRINCIPAL_CACHE_TTL: int = int(os.getenv("PRINCIPAL_CACHE_TTL", 60))
+
+    # Verified access tokens remembered per worker until they expire, so
+    # repeat requests with the same token skip the signature check
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+    # Access tokens are revoked when a user's role or status changes. Other
+    # workers notice within this many seconds, when they reload the table.
+    TOKEN_VERSION_MAX_AGE: int = int(os.getenv("TOKEN_VERSION_MAX_AGE", 30))
+
+    # Worker processes for password hashing; 0 means one per CPU
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+    # Hash/verify calls allowed to wait for a busy worker before logins and
+    # other password checks get 503, and the Retry-After sent with it
+    PASSWORD_HASH_QUEUE_LIMIT: int = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", 32))
+    PASSWORD_HASH_RETRY_AFTER: int = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", 1))
+    # Rows validated, hashed and inserted together by POST /admin/users/import/
+    USER_IMPORT_BATCH_SIZE: int = int(os.getenv("USER_IMPORT_BATCH_SIZE", 500))
+
     MAIL_USERNAME: str = os.getenv("MAIL_USERNAME")
     MAIL_PASSWORD: str = os.getenv("MAIL_PASSWORD")
     MAIL_FROM: str = os.getenv("MAIL_FROM")
@@ -33,6 +76,24 @@ class Settings(BaseSettings):
         "t",
     )
 
+    # Outbound email is queued in email_outbox and sent by this many tasks
+    # per worker process, each keeping its SMTP connection open; 0 leaves
+    # delivery to other processes
+    EMAIL_OUTBOX_WORKERS: int = int(os.getenv("EMAIL_OUTBOX_WORKERS", 2))
+    # Seconds between checks for due messages when nothing wakes the tasks
+    EMAIL_OUTBOX_POLL_INTERVAL: int = int(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", 5))
+    # Messages claimed at once; capped so the batch can be sent within the
+    # lease at EMAIL_SEND_TIMEOUT seconds each (with one timeout to spare)
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 5))
+    # A claimed message is retried after this long if its sender dies
+    EMAIL_OUTBOX_LEASE: int = int(os.getenv("EMAIL_OUTBOX_LEASE", 300))
+    # Failed sends are retried after EMAIL_RETRY_BACKOFF seconds, doubling
+    # each time, until EMAIL_MAX_ATTEMPTS attempts have been made
+    EMAIL_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_MAX_ATTEMPTS", 6))
+    EMAIL_RETRY_BACKOFF: int = int(os.getenv("EMAIL_RETRY_BACKOFF", 30))
+    # Longest a single message may take to send, reconnecting included
+    EMAIL_SEND_TIMEOUT: int = int(os.getenv("EMAIL_SEND_TIMEOUT", 30))
+
 
 settings = Settings()
 
@@ -1,16 +1,151 @@
+import time
+from typing import Dict
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url, URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from app.core.config import settings
+from app.core.security import get_unverified_subject
+from app.core.metrics import register_collector
+from app.core.pool_metrics import InstrumentedAsyncQueuePool
+from app.core.unit_of_work import UnitOfWork
 
-engine = create_engine(settings.DATABASE_URL)
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+# Sync engine, used by scripts (seed.py) and Alembic.
+engine = create_engine(settings.DATABASE_URL, **pool_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def get_async_database_url(database_url: str) -> URL:
+    """Swaps the sync driver in a database URL for its asyncio counterpart."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        return url.set(drivername="postgresql+asyncpg")
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+# Async engine, used by the API so requests don't hold a threadpool slot
+# for the whole database round-trip.
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,
+    **pool_options,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+# Optional read replica, only used by requests that depend on prefer_replica
+replica_engine = None
+ReplicaSessionLocal = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_REPLICA_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options,
+    )
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def get_pool_stats() -> dict:
+    """Returns a snapshot of each API engine's connection pool, by engine name."""
+    stats = {"primary": async_engine.pool.snapshot()}
+    if replica_engine is not None:
+        stats["replica"] = replica_engine.pool.snapshot()
+    return stats
+
+
+register_collector("db_pool", lambda: async_engine.pool.snapshot(), {"engine": "primary"})
+if replica_engine is not None:
+    register_collector(
+        "db_pool", lambda: replica_engine.pool.snapshot(), {"engine": "replica"}
+    )
+
 class Base(DeclarativeBase):
     pass
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close() 
\ No newline at end of file
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# user id -> monotonic time until which their reads stay on the primary.
+# Per worker process, like the pool itself.
+_primary_pins: Dict[str, float] = {}
+
+
+def pin_to_primary(user_key: str):
+    now = time.monotonic()
+    if len(_primary_pins) > 10000:
+        for key, until in list(_primary_pins.items()):
+            if until <= now:
+                del _primary_pins[key]
+    _primary_pins[user_key] = now + settings.DB_REPLICA_PIN_SECONDS
+
+
+def is_pinned_to_primary(user_key: str) -> bool:
+    until = _primary_pins.get(user_key)
+    return until is not None and until > time.monotonic()
+
+
+def _request_user_key(request: Request):
+    # Signature isn't checked here: the key only decides where this
+    # request's reads go. Pins are only ever set for verified users, by
+    # get_current_user, and authentication still happens there.
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return get_unverified_subject(token)
+
+
+def prefer_replica(request: Request):
+    """
+    Route dependency marking a read-only endpoint as safe to serve from the
+    replica. Add it to the route's `dependencies` so it runs before get_db.
+    """
+    request.state.prefer_replica = True
+
+
+def request_session_factory(request: Request) -> async_sessionmaker:
+    """
+    Where a request reads: the replica if the route opted in with
+    prefer_replica, the request is safe and its user isn't pinned to the
+    primary after a recent write; the primary otherwise.
+    """
+    user_key = _request_user_key(request)
+    use_replica = (
+        ReplicaSessionLocal is not None
+        and request.method in SAFE_METHODS
+        and getattr(request.state, "prefer_replica", False)
+        and not (user_key and is_pinned_to_primary(user_key))
+    )
+    return ReplicaSessionLocal if use_replica else AsyncSessionLocal
+
+
+async def get_db(request: Request):
+    """
+    The request's session, run as a unit of work: whatever the request
+    wrote is committed once when the handler returns, or rolled back if it
+    raises. Teardown runs before the response is sent, so the client never
+    sees a response for work that was not committed.
+    """
+    async with request_session_factory(request)() as db:
+        uow = UnitOfWork(db)
+        try:
+            yield db
+        except Exception:
+            await uow.abort()
+            raise
+        await uow.complete()
@@ -1,34 +1,200 @@
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from typing import List, Optional
+import aiosmtplib
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import register_collector
+from app.core.unit_of_work import after_commit
+from app.repositories.async_impl import EmailOutboxRepository
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
-)
+logger = logging.getLogger(__name__)
 
+# Longest wait between retries of a failed message
+MAX_RETRY_DELAY = 3600
 
-async def send_email(email_to: str, subject: str, html_content: str):
+_stats = {"sent_total": 0, "retries_total": 0, "failed_total": 0, "connects_total": 0}
+
+# Set when a message is queued, so idle outbox tasks in this process send
+# it right away instead of at their next poll
+_wakeup = asyncio.Event()
+_stop = asyncio.Event()
+_tasks: List[asyncio.Task] = []
+
+
+class SMTPSender:
     """
-    Sends an email using fastapi-mail.
+    An SMTP connection that is opened on first use and kept for the
+    messages after it. A connection the server has since closed is
+    reopened once before the send is counted as failed.
     """
-    message = MessageSchema(
-        subject=subject, recipients=[email_to], body=html_content, subtype="html"
+
+    def __init__(self):
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            timeout=settings.EMAIL_SEND_TIMEOUT,
+        )
+        await smtp.connect()
+        if settings.MAIL_USERNAME:
+            await smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+        _stats["connects_total"] += 1
+        self._smtp = smtp
+        return smtp
+
+    def _drop(self):
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+
+    async def send(self, recipient: str, subject: str, html_body: str):
+        message = EmailMessage()
+        message["From"] = settings.MAIL_FROM
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(html_body, subtype="html")
+
+        reused = self._smtp is not None and self._smtp.is_connected
+        try:
+            smtp = self._smtp if reused else await self._connect()
+            try:
+                await smtp.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                if not reused:
+                    raise
+                # Most likely the server timed out the idle connection
+                self._drop()
+                smtp = await self._connect()
+                await smtp.send_message(message)
+        except aiosmtplib.SMTPResponseException:
+            # The server refused this message; the connection is still fine
+            raise
+        except BaseException:
+            # Also when cancelled mid-conversation, see deliver_due
+            self._drop()
+            raise
+
+    async def close(self):
+        if self._smtp is not None and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except aiosmtplib.SMTPException:
+                pass
+        self._drop()
+
+
+def next_attempt_at(attempts: int) -> Optional[datetime]:
+    """When to retry a message that has failed `attempts` times, or None to give up."""
+    if attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        return None
+    delay = min(settings.EMAIL_RETRY_BACKOFF * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+    return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+
+async def deliver_due(sender: SMTPSender, limit: int) -> int:
+    """Sends one batch of due messages and returns how many there were."""
+    # Each send is cut off after EMAIL_SEND_TIMEOUT, so a batch of this size
+    # is done before its lease runs out and no other worker claims it again.
+    # One timeout's worth is left for recording the outcomes.
+    limit = min(
+        limit, max(1, settings.EMAIL_OUTBOX_LEASE // settings.EMAIL_SEND_TIMEOUT - 1)
     )
+    async with AsyncSessionLocal() as db:
+        outbox = EmailOutboxRepository(db)
+        emails = await outbox.claim_due(limit, settings.EMAIL_OUTBOX_LEASE)
+        await db.commit()
+        for email in emails:
+            try:
+                # aiosmtplib's timeout is per command, and a reconnect
+                # makes several, so the whole send is bounded here
+                await asyncio.wait_for(
+                    sender.send(email.recipient, email.subject, email.html_body),
+                    settings.EMAIL_SEND_TIMEOUT,
+                )
+            except Exception as e:
+                retry_at = next_attempt_at(email.attempts)
+                _stats["retries_total" if retry_at else "failed_total"] += 1
+                logger.warning(
+                    "Sending email %s to %s failed (attempt %s): %r",
+                    email.id,
+                    email.recipient,
+                    email.attempts,
+                    e,
+                )
+                await outbox.mark_failed(email.id, repr(e), retry_at)
+            else:
+                _stats["sent_total"] += 1
+                await outbox.mark_sent(email.id)
+            # Record each outcome as it happens, so a crash mid-batch
+            # doesn't send the earlier messages again
+            await db.commit()
+        return len(emails)
+
+
+async def run_outbox_worker():
+    sender = SMTPSender()
+    try:
+        while not _stop.is_set():
+            # Cleared before looking, so a message queued meanwhile isn't missed
+            _wakeup.clear()
+            try:
+                if await deliver_due(sender, settings.EMAIL_OUTBOX_BATCH_SIZE):
+                    continue
+            except Exception:
+                logger.exception("Email outbox delivery failed")
+            try:
+                await asyncio.wait_for(
+                    _wakeup.wait(), settings.EMAIL_OUTBOX_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await sender.close()
+
+
+def start_outbox_workers():
+    _stop.clear()
+    for _ in range(settings.EMAIL_OUTBOX_WORKERS):
+        _tasks.append(asyncio.create_task(run_outbox_worker()))
+
 
-    fm = FastMail(conf)
-    await fm.send_message(message)
+async def stop_outbox_workers(timeout: float = 10):
+    """Lets the outbox tasks finish the message in hand, then stops them."""
+    _stop.set()
+    _wakeup.set()
+    if _tasks:
+        _, pending = await asyncio.wait(_tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    _tasks.clear()
+
+
+register_collector("email_outbox", lambda: dict(_stats))
+
+
+async def send_email(db: AsyncSession, email_to: str, subject: str, html_content: str):
+    """
+    Queues an email in the outbox. It is sent by the outbox workers once the
+    caller's transaction commits, and never if it rolls back.
+    """
+    await EmailOutboxRepository(db).enqueue(email_to, subject, html_content)
+    after_commit(db, _wakeup.set)
 
 
-async def send_password_reset_email(email_to: str, callback_url: str, token: str):
+async def send_password_reset_email(
+    db: AsyncSession, email_to: str, callback_url: str, token: str
+):
     """
-    Constructs and sends the password reset email.
+    Constructs and queues the password reset email.
     """
     reset_url = f"{callback_url}?token={token}"
     subject = "Reset Your Password"
@@ -47,4 +213,4 @@ async def send_password_reset_email(email_to: str, callback_url: str, token: str
     </html>
     """
 
-    await send_email(email_to, subject, html_content)
+    await send_email(db, email_to, subject, html_content)
@@ -14,7 +14,8 @@ def create_error_response(
     message: str,
     status_code: int,
     error_code: str = None,
-    details: dict = None
+    details: dict = None,
+    headers: dict = None
 ) -> JSONResponse:
     """Create a standardized error response."""
     error_response = ErrorResponse(
@@ -25,7 +26,8 @@ def create_error_response(
     )
     return JSONResponse(
         status_code=status_code,
-        content=error_response.model_dump()
+        content=error_response.model_dump(),
+        headers=headers
     )
 
 
@@ -35,7 +37,8 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
         message=exc.message,
         status_code=exc.status_code,
         error_code=exc.error_code,
-        details=exc.details
+        details=exc.details,
+        headers=exc.headers
     )
 
 
@@ -10,9 +10,10 @@ class AppException(HTTPException):
         status_code: int,
         message: str,
         error_code: Optional[str] = None,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
     ):
-        super().__init__(status_code=status_code, detail=message)
+        super().__init__(status_code=status_code, detail=message, headers=headers)
         self.message = message
         self.error_code = error_code
         self.details = details or {}
@@ -85,4 +86,20 @@ class InternalServerError(AppException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message=message,
             error_code="INTERNAL_SERVER_ERROR"
-        ) 
\ No newline at end of file
+        )
+
+
+class ServiceUnavailableError(AppException):
+    """Exception for temporary overload; clients should retry later."""
+    
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        retry_after: Optional[int] = None
+    ):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=message,
+            error_code="SERVICE_UNAVAILABLE",
+            headers={"Retry-After": str(retry_after)} if retry_after else None
+        ) 
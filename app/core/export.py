@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, AsyncIterable, AsyncIterator, Sequence
+
+# Export formats and their media types
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Rows are buffered into chunks of about this size before being sent, so a
+# large export is neither one write per row nor held in memory
+FLUSH_BYTES = 64 * 1024
+
+
+def _plain(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+async def encode_rows(
+    fmt: str, columns: Sequence[str], rows: AsyncIterable[Sequence[Any]]
+) -> AsyncIterator[str]:
+    """Encodes rows as CSV (with a header) or NDJSON, yielding text chunks."""
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+
+        def write(row):
+            writer.writerow([_plain(value) for value in row])
+
+    else:
+
+        def write(row):
+            buffer.write(json.dumps(dict(zip(columns, map(_plain, row)))))
+            buffer.write("\n")
+
+    async for row in rows:
+        write(row)
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
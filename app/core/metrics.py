@@ -0,0 +1,37 @@
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Each collector returns a flat {metric_name: value} dict when scraped.
+Collector = Callable[[], Dict[str, float]]
+
+_collectors: List[Tuple[str, Collector, Dict[str, str]]] = []
+
+
+def register_collector(
+    namespace: str, collect: Collector, labels: Optional[Dict[str, str]] = None
+):
+    """Registers a callable whose values are exported under `a2sv_<namespace>_`."""
+    _collectors.append((namespace, collect, labels or {}))
+
+
+def render_prometheus() -> str:
+    """
+    Renders every registered collector in the Prometheus text format.
+
+    Values are per process, so each sample carries the worker pid; sum or
+    max across pids to get a figure for the whole deployment.
+    """
+    samples: Dict[str, List[str]] = {}
+    for namespace, collect, labels in _collectors:
+        label_set = {**labels, "pid": str(os.getpid())}
+        rendered_labels = ",".join(f'{k}="{v}"' for k, v in label_set.items())
+        for key, value in collect().items():
+            name = f"a2sv_{namespace}_{key}"
+            samples.setdefault(name, []).append(f"{name}{{{rendered_labels}}} {value}")
+
+    lines = []
+    for name, rows in samples.items():
+        metric_type = "counter" if name.endswith("_total") else "gauge"
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(rows)
+    return "\n".join(lines) + "\n"
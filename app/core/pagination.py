@@ -0,0 +1,41 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Callable, Optional, Tuple, Any
+from app.core.utils import raise_validation_error
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: Any) -> str:
+    """
+    Encodes a (timestamp, id) keyset position as an opaque URL-safe string.
+    A None timestamp is a position among the rows that have none, which the
+    lists put last.
+    """
+    payload = json.dumps(
+        [sort_value.isoformat() if sort_value is not None else None, str(row_id)]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, id_type: Callable[[str], Any] = uuid.UUID
+) -> Tuple[Optional[datetime], Any]:
+    """Decodes a cursor produced by encode_cursor back into (timestamp, id)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if sort_value is not None:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, id_type(row_id)
+    except (ValueError, TypeError):
+        raise_validation_error("Invalid pagination cursor.")
+
+
+def next_cursor(
+    items: list, limit: int, key: Callable[[Any], Tuple[Optional[datetime], Any]]
+) -> Optional[str]:
+    """Returns the cursor for the page after `items`, or None on the last page."""
+    if len(items) < limit:
+        return None
+    return encode_cursor(*key(items[-1]))
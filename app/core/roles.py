@@ -0,0 +1,59 @@
+from types import MappingProxyType
+from typing import Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities import Role
+from app.repositories.async_impl import RoleRepository
+
+# Role names seeded by seed.py; code refers to roles by these, never by id
+APPLICANT = "applicant"
+REVIEWER = "reviewer"
+MANAGER = "manager"
+ADMIN = "admin"
+
+
+class RoleRegistry:
+    """
+    Read-only snapshot of the roles table. Roles don't change at runtime,
+    so it is loaded once per worker and replaced wholesale on reload
+    rather than modified.
+    """
+
+    def __init__(self, roles: Iterable[Role]):
+        roles = list(roles)
+        self._by_id = MappingProxyType({role.id: role for role in roles})
+        self._by_name = MappingProxyType({role.name: role for role in roles})
+
+    def get_by_id(self, role_id: Optional[int]) -> Optional[Role]:
+        return self._by_id.get(role_id)
+
+    def get_by_name(self, name: str) -> Optional[Role]:
+        return self._by_name.get(name)
+
+    def list_all(self) -> List[Role]:
+        return list(self._by_id.values())
+
+    def id_of(self, name: str) -> Optional[int]:
+        role = self._by_name.get(name)
+        return role.id if role else None
+
+    def name_of(self, role_id: Optional[int]) -> str:
+        role = self._by_id.get(role_id)
+        return role.name if role else ""
+
+
+_registry: Optional[RoleRegistry] = None
+
+
+async def load_role_registry(db: AsyncSession) -> RoleRegistry:
+    """(Re)reads the roles table and swaps in a new registry."""
+    global _registry
+    _registry = RoleRegistry(await RoleRepository(db).list_all())
+    return _registry
+
+
+async def get_role_registry(db: AsyncSession) -> RoleRegistry:
+    """The loaded registry, reading the roles table only if it hasn't been yet."""
+    # An empty registry means the table wasn't seeded yet; keep looking
+    if _registry is None or not _registry.list_all():
+        return await load_role_registry(db)
+    return _registry
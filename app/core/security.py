@@ -1,8 +1,18 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Sequence
 from passlib.context import CryptContext
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from app.core.config import settings
-from app.core.utils import raise_unauthorized
+from app.core.cache import token_cache
+from app.core.metrics import register_collector
+from app.core.utils import raise_service_unavailable, raise_unauthorized
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -17,6 +27,117 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# bcrypt is CPU-bound and takes a few hundred milliseconds per call, so it
+# runs in a dedicated pool of worker processes: it uses every core instead
+# of contending for the GIL, and doesn't tie up the threadpool that serves
+# sync dependencies and file I/O.
+_hash_pool: Optional[ProcessPoolExecutor] = None
+# Jobs submitted to the pool and not finished yet, running or queued
+_in_flight = 0
+_stats = {"submitted_total": 0, "rejected_total": 0, "broken_pool_total": 0}
+
+
+def hash_pool_size() -> int:
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+def _hash_pool_context():
+    # Forking a process that already runs threads (the anyio threadpool,
+    # database driver threads) can leave the child holding a lock no thread
+    # will release. Workers are forked from a clean forkserver process
+    # instead, or spawned where there is none.
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Imported once by the forkserver, so each worker starts with it loaded
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=hash_pool_size(), mp_context=_hash_pool_context()
+        )
+    return _hash_pool
+
+
+def start_hash_pool():
+    """
+    Starts the worker processes, from the app's lifespan, so the first
+    login doesn't wait for them. With a forkserver or spawn context they
+    are all launched on the first submit.
+    """
+    get_hash_pool().submit(os.getpid)
+
+
+def shutdown_hash_pool():
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(cancel_futures=True)
+        _hash_pool = None
+
+
+async def _run_in_hash_pool(fn, *args):
+    global _hash_pool, _in_flight
+    pool = get_hash_pool()
+    _in_flight += 1
+    _stats["submitted_total"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool for later calls
+        _stats["broken_pool_total"] += 1
+        if _hash_pool is pool:
+            _hash_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        _in_flight -= 1
+
+
+async def _run_or_reject(fn, *args):
+    # Beyond one job per worker plus the queue limit, callers would wait
+    # longer than a client is likely to; shed the load instead
+    if _in_flight >= hash_pool_size() + settings.PASSWORD_HASH_QUEUE_LIMIT:
+        _stats["rejected_total"] += 1
+        raise_service_unavailable(
+            "Server is busy, please retry shortly.",
+            retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+        )
+    return await _run_in_hash_pool(fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_or_reject(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_or_reject(verify_password, plain_password, hashed_password)
+
+
+async def hash_passwords_async(passwords: Sequence[str]) -> List[str]:
+    """
+    Hashes a batch (user import). It waits for the pool rather than being
+    rejected, but keeps at most one job per worker in flight so interactive
+    requests still fit in the queue.
+    """
+    slots = asyncio.Semaphore(hash_pool_size())
+
+    async def hash_one(password: str) -> str:
+        async with slots:
+            return await _run_in_hash_pool(hash_password, password)
+
+    return await asyncio.gather(*(hash_one(password) for password in passwords))
+
+
+register_collector(
+    "password_hash",
+    lambda: {"workers": hash_pool_size(), "in_flight": _in_flight, **_stats},
+)
+
+
 # JWT token creation
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
@@ -30,6 +151,21 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     return encoded_jwt
 
 
+def create_user_access_token(user, role: str, token_version: int) -> str:
+    """
+    Access token carrying the user's role, status and token version, so the
+    RBAC guards can authorize it without reading the user.
+    """
+    return create_access_token(
+        {
+            "sub": str(user.id),
+            "role": role,
+            "active": bool(user.is_active),
+            "ver": token_version,
+        }
+    )
+
+
 def create_refresh_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (
@@ -70,3 +206,33 @@ def require_token_type(token: str, expected_type: str):
     if payload is None or payload.get("type") != expected_type:
         raise_unauthorized(f"Invalid or expired token.")
     return payload
+
+
+def verify_access_token(token: str) -> Mapping[str, Any]:
+    """
+    require_token_type(token, "access"), remembering the claims of tokens
+    that pass until they expire, so a client reusing its token skips the
+    signature check. The claims are shared between requests; read only.
+    """
+    claims = token_cache.get(token)
+    if claims is not None:
+        token_cache.hits += 1
+        return claims
+
+    token_cache.misses += 1
+    claims = MappingProxyType(require_token_type(token, "access"))
+    remaining = claims["exp"] - time.time()
+    if remaining > 0:
+        token_cache.set(token, claims, ttl=remaining)
+    return claims
+
+
+def get_unverified_subject(token: str):
+    """
+    Returns the token's `sub` claim without checking its signature or
+    expiry. Only for keying non-security decisions, such as routing reads.
+    """
+    try:
+        return jwt.get_unverified_claims(token).get("sub")
+    except JWTError:
+        return None
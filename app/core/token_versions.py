@@ -0,0 +1,86 @@
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Optional
+from app.core.config import settings
+from app.core.metrics import register_collector
+
+Loader = Callable[[], Awaitable[Dict[uuid.UUID, int]]]
+
+
+class TokenVersionTable:
+    """
+    Per-worker copy of the token_versions table. An access token is only
+    accepted while the version it carries is its user's current one; users
+    not in the table are at version 0.
+
+    The worker that bumps a version applies it as soon as the change
+    commits, and any worker applies one when it sees a token carrying it.
+    Other workers reload the table once it is `max_age` seconds old, so
+    elsewhere a revoked token keeps working for at most that long.
+    """
+
+    def __init__(self, max_age: float):
+        self.max_age = max_age
+        self._versions: Dict[uuid.UUID, int] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+        self.rejected = 0
+
+    def current(self, user_id: uuid.UUID) -> int:
+        return self._versions.get(user_id, 0)
+
+    def is_current(self, user_id: uuid.UUID, version: int) -> bool:
+        """
+        Whether a token carrying `version` is still valid. Tokens are signed
+        with the version read from the database, so one newer than this
+        copy only means the copy is stale: it is accepted and applied.
+        """
+        if version < self.current(user_id):
+            self.rejected += 1
+            return False
+        self.set(user_id, version)
+        return True
+
+    def set(self, user_id: uuid.UUID, version: int):
+        # Versions only go up, so a reload that read the table before this
+        # change committed can't undo it
+        if version > self.current(user_id):
+            self._versions[user_id] = version
+
+    async def refresh_if_stale(self, load: Loader):
+        """Reloads the table with `load` if it is older than `max_age`."""
+        if self._loaded_at is not None:
+            if time.monotonic() - self._loaded_at < self.max_age:
+                return
+            # Someone is already reloading; the current copy will do until then
+            if self._lock.locked():
+                return
+        # Until the first load finishes nothing can be checked, so wait for it
+        async with self._lock:
+            if (
+                self._loaded_at is not None
+                and time.monotonic() - self._loaded_at < self.max_age
+            ):
+                return
+            started = time.monotonic()
+            versions = await load()
+            for user_id, version in self._versions.items():
+                if version > versions.get(user_id, 0):
+                    versions[user_id] = version
+            self._versions = versions
+            self._loaded_at = started
+            self.reloads += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._versions),
+            "reloads_total": self.reloads,
+            "rejected_total": self.rejected,
+        }
+
+
+token_versions = TokenVersionTable(max_age=settings.TOKEN_VERSION_MAX_AGE)
+
+register_collector("token_versions", token_versions.snapshot)
@@ -0,0 +1,105 @@
+import logging
+from typing import Callable
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.metrics import register_collector
+
+logger = logging.getLogger(__name__)
+
+# Per-session state lives in Session.info under these keys
+_HOOKS = "after_commit_hooks"
+_WRITES = "has_writes"
+_COMMITS = "commits"
+
+_stats = {
+    "requests_total": 0,
+    "commits_total": 0,
+    "rollbacks_total": 0,
+    "read_only_requests_total": 0,
+    "multi_commit_requests_total": 0,
+}
+
+
+class UnitOfWork:
+    """
+    One request's database work. Repositories only flush; the request's
+    writes are committed together when it finishes, or rolled back if it
+    fails, by get_db. Side effects that must only happen once the data is
+    durable (cache invalidation, read-replica pinning) are registered with
+    after_commit() and run after that commit.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        _stats["requests_total"] += 1
+
+    @property
+    def has_writes(self) -> bool:
+        return self.session.info.get(_WRITES, False)
+
+    async def complete(self):
+        """Commits if the request wrote anything; otherwise just ends the transaction."""
+        if self.has_writes:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+        commits = self.session.info.get(_COMMITS, 0)
+        if commits == 0:
+            _stats["read_only_requests_total"] += 1
+        elif commits > 1:
+            _stats["multi_commit_requests_total"] += 1
+
+    async def abort(self):
+        """Rolls back everything the request wrote."""
+        if self.has_writes:
+            _stats["rollbacks_total"] += 1
+        await self.session.rollback()
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]):
+    """
+    Runs `callback` once the session's current transaction commits. It is
+    dropped if the transaction rolls back instead.
+    """
+    db.info.setdefault(_HOOKS, []).append(callback)
+
+
+def mark_written(db: AsyncSession):
+    """Flags a write the session can't see, e.g. a COPY on the raw connection."""
+    db.info[_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WRITES] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    session.info[_WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _run_hooks(session):
+    _stats["commits_total"] += 1
+    session.info[_COMMITS] = session.info.get(_COMMITS, 0) + 1
+    session.info[_WRITES] = False
+    for callback in session.info.pop(_HOOKS, []):
+        try:
+            callback()
+        except Exception:
+            # The data is committed; a failed side effect mustn't fail the request
+            logger.exception("after_commit hook %r failed", callback)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_hooks(session, previous_transaction):
+    # Rolling back a savepoint leaves the outer transaction, and its hooks, intact
+    if not previous_transaction.nested:
+        session.info.pop(_HOOKS, None)
+        session.info[_WRITES] = False
+
+
+register_collector("unit_of_work", lambda: dict(_stats))
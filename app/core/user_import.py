@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+from app.core.utils import raise_validation_error
+
+# (line number, parsed record or the reason it could not be parsed)
+ImportRow = Tuple[int, Union[dict, str]]
+
+FORMATS = ("csv", "ndjson")
+
+
+def detect_format(
+    requested: Optional[str], filename: Optional[str], content_type: Optional[str]
+) -> str:
+    """Picks csv or ndjson from the query parameter, file name or content type."""
+    if requested:
+        if requested not in FORMATS:
+            raise_validation_error("Unsupported import format; use csv or ndjson.")
+        return requested
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")) or content_type in (
+        "application/x-ndjson",
+        "application/jsonl",
+    ):
+        return "ndjson"
+    raise_validation_error("Unsupported import format; use csv or ndjson.")
+
+
+def iter_rows(file: IO[bytes], fmt: str) -> Iterator[ImportRow]:
+    """
+    Reads an uploaded file one record at a time, so memory use does not
+    grow with the size of the upload.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, "Invalid JSON."
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object."
+            continue
+        yield line_number, record
+
+
+def batched(rows: Iterable[ImportRow], size: int) -> Iterator[List[ImportRow]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -5,7 +5,8 @@ from app.core.exceptions import (
     ForbiddenError, 
     ConflictError, 
     ValidationError,
-    InternalServerError
+    InternalServerError,
+    ServiceUnavailableError
 )
 
 
@@ -39,6 +40,13 @@ def raise_internal_error(message: str = "Internal server error"):
     raise InternalServerError(message)
 
 
+def raise_service_unavailable(
+    message: str = "Service temporarily unavailable", retry_after: Optional[int] = None
+):
+    """Raise a service unavailable exception, telling clients when to retry."""
+    raise ServiceUnavailableError(message, retry_after)
+
+
 def safe_get_attr(obj, attr_name: str, default=None):
     """Safely get an attribute from an object."""
     return getattr(obj, attr_name, default)
@@ -1,4 +1,6 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer
@@ -11,13 +13,38 @@ from app.api.manager import router as manager_router
 from app.api.profile import router as profile_router
 from app.api.reviews import router as reviews_router
 from app.core.error_handlers import register_exception_handlers
+from app.core.metrics import render_prometheus
+from app.core.security import start_hash_pool, shutdown_hash_pool
+from app.core.email import start_outbox_workers, stop_outbox_workers
+from app.core.database import AsyncSessionLocal
+from app.core.roles import load_role_registry
 
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_hash_pool()
+    try:
+        async with AsyncSessionLocal() as db:
+            await load_role_registry(db)
+    except Exception:
+        # Not fatal: the first request that needs the roles loads them
+        logger.exception("Could not load roles at startup")
+    start_outbox_workers()
+    yield
+    await stop_outbox_workers()
+    shutdown_hash_pool()
+
+
 app = FastAPI(
     title="AppPlatform API",
     description="Application Platform API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Register exception handlers
@@ -49,6 +76,12 @@ async def custom_swagger_ui_html():
     )
 
 
+# Prometheus scrape endpoint for per-worker runtime metrics
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(render_prometheus())
+
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(applications_router)
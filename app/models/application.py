@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -6,6 +6,16 @@ from app.core.database import Base
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Manager list/count, with and without a status filter
+        Index("ix_applications_cycle_status_submitted", "cycle_id", "status", "submitted_at", "id"),
+        Index("ix_applications_cycle_submitted", "cycle_id", "submitted_at", "id"),
+        # Reviewer's assigned list
+        Index("ix_applications_reviewer_submitted", "assigned_reviewer_id", "submitted_at", "id"),
+        Index("ix_applications_applicant_id", "applicant_id"),
+        # Review-time percentiles per cycle
+        Index("ix_applications_cycle_review_duration", "cycle_id", "review_duration_seconds"),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     applicant_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     cycle_id = Column(Integer, ForeignKey("application_cycles.id"), nullable=False)
@@ -22,4 +32,7 @@ class Application(Base):
     assigned_reviewer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     decision_notes = Column(Text, nullable=True)
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set when a manager accepts or rejects the application
+    decided_at = Column(DateTime(timezone=True), nullable=True)
+    review_duration_seconds = Column(Integer, nullable=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) 
\ No newline at end of file
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 class ApplicationCycle(Base):
     __tablename__ = "application_cycles"
+    __table_args__ = (Index("ix_application_cycles_created", "created_at", "id"),)
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     start_date = Column(Date, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.core.database import Base
+
+
+class ApplicationStat(Base):
+    """
+    Running count of a cycle's applications per (dimension, bucket), e.g.
+    ("status", "accepted") or ("country", "Ethiopia"). Kept in step by
+    ApplicationRepository writes; reconcile_stats.py rebuilds it.
+    """
+
+    __tablename__ = "application_stats"
+    cycle_id = Column(
+        Integer,
+        ForeignKey("application_cycles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    dimension = Column(String(20), primary_key=True)
+    bucket = Column(String(255), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
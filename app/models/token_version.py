@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# User columns that access tokens carry as claims; changing one revokes them
+TOKEN_CLAIM_COLUMNS = ("role_id", "is_active")
+
+
+class TokenVersion(Base):
+    """
+    Current access-token version of users whose role or status has changed,
+    or who were deleted; everyone else is at version 0. Access tokens carry
+    the version they were issued at and stop working once it is bumped.
+    Deliberately not a foreign key to users, so deletions are remembered.
+    """
+
+    __tablename__ = "token_versions"
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,1429 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy import (
+    Float,
+    Integer,
+    case,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    tuple_,
+    type_coerce,
+    update,
+)
+from app.domain.entities import (
+    User,
+    Role,
+    Application,
+    ApplicationCycle,
+    ApplicationSummary,
+    ApplicationAnalytics,
+)
+from app.models.user import User as UserModel
+from app.models.role import Role as RoleModel
+from app.models.application import Application as ApplicationModel
+from app.models.application_cycle import ApplicationCycle as ApplicationCycleModel
+from app.models.review import Review as ReviewModel
+from app.models.application_stat import ApplicationStat as ApplicationStatModel
+from app.models.email_outbox import EmailOutbox as EmailOutboxModel
+from app.models.token_version import TokenVersion as TokenVersionModel, TOKEN_CLAIM_COLUMNS
+from sqlalchemy.dialects import postgresql, sqlite
+from app.core.cache import analytics_cache, principal_cache
+from app.core.token_versions import token_versions
+from app.core.unit_of_work import after_commit, mark_written
+from app.repositories.mappers import (
+    USER,
+    PRINCIPAL,
+    ROLE,
+    APPLICATION,
+    APPLICATION_CYCLE,
+    APPLICATION_SUMMARY,
+    REVIEW,
+    OUTBOX_EMAIL,
+)
+from app.repositories.interfaces import (
+    IUserRepository,
+    IRoleRepository,
+    IApplicationRepository,
+    IApplicationCycleRepository,
+    IReviewRepository,
+    IApplicationStatRepository,
+    ITokenVersionRepository,
+    IEmailOutboxRepository,
+)
+import uuid
+import math
+import heapq
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Repository writes only flush. The request's unit of work (get_db, see
+# app.core.unit_of_work) commits them together, or rolls them back.
+
+# Statuses an application ends in once a manager has decided on it
+FINAL_STATUSES = ("accepted", "rejected")
+
+# Status of an application its applicant is still writing
+DRAFT_STATUS = "in_progress"
+
+# Statuses a decision can't be recorded from: drafts and decided applications
+NOT_DECIDABLE = (DRAFT_STATUS, *FINAL_STATUSES)
+
+# Order of the application lists. Drafts have no submitted_at yet; they
+# come after every submitted application, by id, on both dialects
+SUMMARY_ORDER = (ApplicationModel.submitted_at.asc().nulls_last(), ApplicationModel.id)
+
+# Application columns that application_stats keeps per-cycle counts of
+STAT_DIMENSIONS = ("status", "school", "country")
+
+# Most ids bound into one IN (...) by bulk updates; keeps each statement
+# well under the driver's bind parameter limit
+BULK_CHUNK_SIZE = 1000
+
+
+# Rows fetched per round trip by streaming exports
+EXPORT_BATCH_SIZE = 500
+
+def chunked(items: Sequence, size: int = BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def dialect_insert(db, model):
+    """INSERT for the session's dialect, for its ON CONFLICT support."""
+    # Both dialects spell the upsert the same way
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
+def review_duration_seconds(submitted_at: Optional[datetime], decided_at: datetime):
+    """Whole seconds from submission to decision, or None if never submitted."""
+    if submitted_at is None:
+        return None
+    # SQLite hands back naive datetimes; the column is stored as UTC
+    if submitted_at.tzinfo is None:
+        submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+    return max(int((decided_at - submitted_at).total_seconds()), 0)
+
+
+class UserRepository(IUserRepository):
+    """AsyncSession implementation of IUserRepository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.token_versions = TokenVersionRepository(db)
+
+    @staticmethod
+    def _to_entity(user: UserModel) -> User:
+        return USER.from_object(user)
+
+    async def _get_model(self, user_id: uuid.UUID):
+        result = await self.db.execute(select(UserModel).where(UserModel.id == user_id))
+        return result.scalars().first()
+
+    async def _fetch(self, query):
+        # Read paths select plain columns: no ORM instances or identity map
+        result = await self.db.execute(query)
+        return [USER.from_row(row) for row in result.all()]
+
+    async def get_by_email(self, email: str):
+        users = await self._fetch(select(*USER.columns).where(UserModel.email == email))
+        return users[0] if users else None
+
+    async def get_by_id(self, user_id: uuid.UUID):
+        users = await self._fetch(select(*USER.columns).where(UserModel.id == user_id))
+        return users[0] if users else None
+
+    async def get_principal(self, user_id: uuid.UUID):
+        """What authentication needs about a user; never the password hash."""
+        result = await self.db.execute(
+            select(*PRINCIPAL.columns).where(UserModel.id == user_id)
+        )
+        row = result.first()
+        return PRINCIPAL.from_row(row) if row else None
+
+    async def create(self, user: User):
+        db_user = UserModel(
+            id=user.id,
+            email=user.email,
+            password=user.password,
+            full_name=user.full_name,
+            profile_picture_url=user.profile_picture_url,
+            role_id=user.role_id,
+            is_active=1 if user.is_active else 0,  # Convert boolean to integer
+        )
+        self.db.add(db_user)
+        await self.db.flush()
+        await self.db.refresh(db_user)
+        return self._to_entity(db_user)
+
+    async def existing_emails(self, emails: Sequence[str]):
+        """Returns which of `emails` already belong to a user."""
+        found = set()
+        for batch in chunked(list(emails)):
+            result = await self.db.execute(
+                select(UserModel.email).where(UserModel.email.in_(batch))
+            )
+            found.update(result.scalars().all())
+        return found
+
+    # Columns bulk_create writes; created_at/updated_at take the server default
+    _BULK_COLUMNS = ("id", "email", "password", "full_name", "role_id", "is_active")
+
+    @staticmethod
+    def _bulk_values(user: User):
+        return (
+            user.id,
+            user.email,
+            user.password,
+            user.full_name,
+            user.role_id,
+            1 if user.is_active else 0,
+        )
+
+    async def bulk_create(self, users: Sequence[User]):
+        """
+        Inserts many users. On asyncpg the rows are streamed with
+        COPY; elsewhere, or if COPY hits an email registered since the caller
+        checked, they go in as batched INSERT ... ON CONFLICT DO NOTHING.
+
+        Returns the emails that were inserted; the rest already existed.
+        """
+        if not users:
+            return set()
+        if self.db.bind.dialect.driver == "asyncpg":
+            from asyncpg.exceptions import UniqueViolationError
+
+            try:
+                # COPY aborts as a whole on a conflict; the savepoint keeps
+                # the transaction usable for the fallback
+                async with self.db.begin_nested():
+                    await self._copy(users)
+                mark_written(self.db)
+                return {user.email for user in users}
+            except UniqueViolationError:
+                pass
+        return await self._insert_ignoring_conflicts(users)
+
+    async def _copy(self, users: Sequence[User]):
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            UserModel.__tablename__,
+            columns=self._BULK_COLUMNS,
+            records=[self._bulk_values(user) for user in users],
+        )
+
+    async def _insert_ignoring_conflicts(self, users: Sequence[User]):
+        inserted = set()
+        for batch in chunked(users):
+            stmt = (
+                dialect_insert(self.db, UserModel)
+                .values(
+                    [dict(zip(self._BULK_COLUMNS, self._bulk_values(u))) for u in batch]
+                )
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(UserModel.email)
+            )
+            inserted.update((await self.db.execute(stmt)).scalars().all())
+        return inserted
+
+    async def list_all(self, offset: int = 0, limit: int = None):
+        query = select(*USER.columns).order_by(UserModel.created_at, UserModel.id)
+        if limit is not None:
+            query = query.offset(offset).limit(limit)
+        return await self._fetch(query)
+
+    async def list_after(
+        self, after: Optional[Tuple[datetime, uuid.UUID]], limit: int
+    ):
+        """Keyset page of users ordered by (created_at, id), starting after `after`."""
+        query = select(*USER.columns).order_by(UserModel.created_at, UserModel.id)
+        if after is not None:
+            query = query.where(tuple_(UserModel.created_at, UserModel.id) > after)
+        return await self._fetch(query.limit(limit))
+
+    async def list_by_role(self, role_id: int, offset: int = 0, limit: int = None):
+        query = (
+            select(*USER.columns)
+            .where(UserModel.role_id == role_id)
+            .order_by(UserModel.created_at, UserModel.id)
+        )
+        if limit is not None:
+            query = query.offset(offset).limit(limit)
+        return await self._fetch(query)
+
+    async def count_all(self):
+        return await self.db.scalar(select(func.count()).select_from(UserModel))
+
+    async def count_by_role(self, role_id: int):
+        return await self.db.scalar(
+            select(func.count(UserModel.id)).where(UserModel.role_id == role_id)
+        )
+
+    async def active_ids_with_role(self, user_ids: Sequence[uuid.UUID], role_id: int):
+        """Returns which of `user_ids` are active users with the given role."""
+        result = await self.db.execute(
+            select(UserModel.id).where(
+                UserModel.id.in_(user_ids),
+                UserModel.role_id == role_id,
+                UserModel.is_active == 1,
+            )
+        )
+        return set(result.scalars().all())
+
+    async def update(self, user_id: uuid.UUID, **kwargs):
+        user = await self._get_model(user_id)
+        if not user:
+            return None
+        revoke = any(
+            kwargs.get(key) is not None and kwargs[key] != getattr(user, key)
+            for key in TOKEN_CLAIM_COLUMNS
+        )
+        for key, value in kwargs.items():
+            if hasattr(user, key) and value is not None:
+                setattr(user, key, value)
+        await self.db.flush()
+        if revoke:
+            await self.token_versions.bump(user_id)
+        await self.db.refresh(user)
+        after_commit(self.db, lambda: principal_cache.invalidate(user_id))
+        return self._to_entity(user)
+
+    async def delete(self, user_id: uuid.UUID):
+        user = await self._get_model(user_id)
+        if not user:
+            return False
+        await self.db.delete(user)
+        await self.db.flush()
+        await self.token_versions.bump(user_id)
+        after_commit(self.db, lambda: principal_cache.invalidate(user_id))
+        return True
+
+
+class ApplicationRepository(IApplicationRepository):
+    """AsyncSession implementation of IApplicationRepository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.stats = ApplicationStatRepository(db)
+
+    @staticmethod
+    def _to_entity(app: ApplicationModel) -> Application:
+        return APPLICATION.from_object(app)
+
+    async def _get_model(self, application_id: uuid.UUID):
+        result = await self.db.execute(
+            select(ApplicationModel).where(ApplicationModel.id == application_id)
+        )
+        return result.scalars().first()
+
+    async def _fetch_one(self, condition):
+        result = await self.db.execute(select(*APPLICATION.columns).where(condition))
+        row = result.first()
+        return APPLICATION.from_row(row) if row else None
+
+    async def get_by_id(self, application_id: uuid.UUID):
+        return await self._fetch_one(ApplicationModel.id == application_id)
+
+    async def get_by_applicant_id(self, applicant_id: uuid.UUID):
+        return await self._fetch_one(ApplicationModel.applicant_id == applicant_id)
+
+    async def create(self, application: Application):
+        db_app = ApplicationModel(
+            id=application.id,
+            applicant_id=application.applicant_id,
+            cycle_id=application.cycle_id,
+            status=application.status,
+            school=application.school,
+            student_id=application.student_id,
+            country=application.country,
+            degree=application.degree,
+            leetcode_handle=application.leetcode_handle,
+            codeforces_handle=application.codeforces_handle,
+            essay_why_a2sv=application.essay_why_a2sv,
+            essay_about_you=application.essay_about_you,
+            resume_url=application.resume_url,
+            assigned_reviewer_id=application.assigned_reviewer_id,
+            decision_notes=application.decision_notes,
+        )
+        self.db.add(db_app)
+        await self._apply_stats(db_app.cycle_id, self._stat_changes(None, db_app))
+        await self.db.refresh(db_app)
+        return self._to_entity(db_app)
+
+    async def update(self, application: Application):
+        db_app = await self._get_model(application.id)
+        if not db_app:
+            return None
+        before = {dimension: getattr(db_app, dimension) for dimension in STAT_DIMENSIONS}
+        for key, value in APPLICATION.values(application).items():
+            if hasattr(db_app, key) and value is not None:
+                setattr(db_app, key, value)
+
+        await self._apply_stats(db_app.cycle_id, self._stat_changes(before, db_app))
+        await self.db.refresh(db_app)
+        return self._to_entity(db_app)
+
+    async def delete(self, application_id: uuid.UUID):
+        result = await self.db.execute(
+            delete(ApplicationModel)
+            .where(ApplicationModel.id == application_id)
+            .returning(ApplicationModel.cycle_id, *self._stat_columns())
+        )
+        row = result.first()
+        if not row:
+            return False
+        await self._apply_stats(row.cycle_id, self._stat_changes(row, None))
+        return True
+
+    async def _apply_stats(self, cycle_id: int, changes):
+        """
+        Flushes the write and applies its counter changes in the same
+        transaction. Cached analytics for the cycle, and for all cycles, are
+        dropped only after the commit so a concurrent reload can't cache
+        the old state.
+        """
+        await self._apply_cycle_stats({cycle_id: changes})
+
+    async def _apply_cycle_stats(self, changes_by_cycle: Dict[int, list]):
+        """_apply_stats for a write that spans several cycles."""
+        await self.db.flush()
+        for cycle_id, changes in changes_by_cycle.items():
+            await self.stats.apply(cycle_id, changes)
+        changed = [cycle_id for cycle_id, changes in changes_by_cycle.items() if changes]
+        if changed:
+            after_commit(self.db, lambda: analytics_cache.invalidate(*changed, None))
+
+    @staticmethod
+    def _stat_columns():
+        return [getattr(ApplicationModel, dimension) for dimension in STAT_DIMENSIONS]
+
+    @staticmethod
+    def _stat_changes(before, after):
+        """
+        Returns the (dimension, bucket, delta) counter changes for a row
+        going from `before` to `after`; either side may be None (create/delete)
+        and may be a dict, a Row or a model.
+        """
+
+        def value(source, dimension):
+            if isinstance(source, dict):
+                return source.get(dimension)
+            return getattr(source, dimension)
+
+        changes = []
+        for dimension in STAT_DIMENSIONS:
+            old = value(before, dimension) if before is not None else None
+            new = value(after, dimension) if after is not None else None
+            if old == new:
+                continue
+            if old is not None:
+                changes.append((dimension, old, -1))
+            if new is not None:
+                changes.append((dimension, new, 1))
+        return changes
+
+    @staticmethod
+    def _status_moves(moved: Counter, new_status: str):
+        """
+        Counter changes for a bulk write moving applications to `new_status`,
+        given how many came from each old status. One change per status,
+        however many rows moved.
+        """
+        moved = {old: n for old, n in moved.items() if old != new_status}
+        changes = [("status", old, -n) for old, n in moved.items()]
+        if moved:
+            changes.append(("status", new_status, sum(moved.values())))
+        return changes
+
+    # Columns for callers that only need an application's state, not its
+    # content. Essays and decision notes make up most of a row.
+    _SUMMARY_COLUMNS = (
+        ApplicationModel.id,
+        ApplicationModel.applicant_id,
+        ApplicationModel.cycle_id,
+        ApplicationModel.status,
+        ApplicationModel.school,
+        ApplicationModel.country,
+        ApplicationModel.degree,
+        ApplicationModel.submitted_at,
+        ApplicationModel.assigned_reviewer_id,
+    )
+
+    @staticmethod
+    def _row_to_summary(row) -> ApplicationSummary:
+        return APPLICATION_SUMMARY.from_object(row)
+
+    async def get_summary(self, application_id: uuid.UUID):
+        """Like get_by_id, but without the essay and decision note columns."""
+        result = await self.db.execute(
+            select(*self._SUMMARY_COLUMNS).where(ApplicationModel.id == application_id)
+        )
+        row = result.first()
+        return self._row_to_summary(row) if row else None
+
+    async def get_summary_by_applicant(self, applicant_id: uuid.UUID):
+        """Like get_by_applicant_id, but without the essay and decision note columns."""
+        result = await self.db.execute(
+            select(*self._SUMMARY_COLUMNS)
+            .where(ApplicationModel.applicant_id == applicant_id)
+            .limit(1)
+        )
+        row = result.first()
+        return self._row_to_summary(row) if row else None
+
+    async def exists_for_applicant(self, applicant_id: uuid.UUID) -> bool:
+        return await self.db.scalar(
+            select(
+                select(ApplicationModel.id)
+                .where(ApplicationModel.applicant_id == applicant_id)
+                .exists()
+            )
+        )
+
+    async def list_by_reviewer(
+        self, reviewer_id: uuid.UUID, offset: int = 0, limit: int = None
+    ):
+        return await self.list_summaries_by_reviewer(
+            reviewer_id, offset=offset, limit=limit
+        )
+
+    @staticmethod
+    def _summaries_query(cycle_id: int, status: str = None):
+        applicant = aliased(UserModel)
+        reviewer = aliased(UserModel)
+        query = (
+            select(
+                ApplicationModel.id,
+                ApplicationModel.applicant_id,
+                applicant.full_name.label("applicant_name"),
+                ApplicationModel.cycle_id,
+                ApplicationModel.status,
+                ApplicationModel.submitted_at,
+                ApplicationModel.assigned_reviewer_id,
+                reviewer.full_name.label("assigned_reviewer_name"),
+            )
+            .outerjoin(applicant, applicant.id == ApplicationModel.applicant_id)
+            .outerjoin(reviewer, reviewer.id == ApplicationModel.assigned_reviewer_id)
+            .where(ApplicationModel.cycle_id == cycle_id)
+            .order_by(*SUMMARY_ORDER)
+        )
+        if status:
+            query = query.where(ApplicationModel.status == status)
+        return query
+
+    @staticmethod
+    def _reviewer_summaries_query(reviewer_id: uuid.UUID):
+        return (
+            select(
+                ApplicationModel.id,
+                ApplicationModel.applicant_id,
+                UserModel.full_name.label("applicant_name"),
+                ApplicationModel.cycle_id,
+                ApplicationModel.status,
+                ApplicationModel.submitted_at,
+                ApplicationModel.assigned_reviewer_id,
+            )
+            .outerjoin(UserModel, UserModel.id == ApplicationModel.applicant_id)
+            .where(ApplicationModel.assigned_reviewer_id == reviewer_id)
+            .order_by(*SUMMARY_ORDER)
+        )
+
+    async def _fetch_summaries(self, query):
+        result = await self.db.execute(query)
+        return [self._row_to_summary(row) for row in result.all()]
+
+    async def _fetch_summaries_after(
+        self, query, after: Optional[Tuple[Optional[datetime], uuid.UUID]], limit: int
+    ):
+        """
+        The page of `query` after the keyset position `after`, in SUMMARY_ORDER.
+        A row-value comparison is never true for a draft's NULL submitted_at,
+        so the submitted rows and the drafts are read as two ranges of the
+        same index; the second query only runs once the first runs out.
+        """
+        submitted_at, id_ = ApplicationModel.submitted_at, ApplicationModel.id
+        summaries = []
+        if after is None or after[0] is not None:
+            submitted = query.where(submitted_at.is_not(None))
+            if after is not None:
+                submitted = submitted.where(tuple_(submitted_at, id_) > after)
+            summaries = await self._fetch_summaries(
+                submitted.order_by(None).order_by(submitted_at, id_).limit(limit)
+            )
+            if len(summaries) == limit:
+                return summaries
+        drafts = query.where(submitted_at.is_(None))
+        if after is not None and after[0] is None:
+            drafts = drafts.where(id_ > after[1])
+        return summaries + await self._fetch_summaries(
+            drafts.order_by(None).order_by(id_).limit(limit - len(summaries))
+        )
+
+    async def list_summaries(
+        self,
+        cycle_id: int,
+        status: str = None,
+        offset: int = 0,
+        limit: int = None,
+    ):
+        """
+        Returns application summaries for a cycle with the applicant and
+        assigned reviewer names resolved in a single joined query.
+        """
+        query = self._summaries_query(cycle_id, status)
+        if limit is not None:
+            query = query.offset(offset).limit(limit)
+        return await self._fetch_summaries(query)
+
+    async def list_summaries_after(
+        self,
+        cycle_id: int,
+        after: Optional[Tuple[Optional[datetime], uuid.UUID]],
+        limit: int,
+        status: str = None,
+    ):
+        """Keyset variant of list_summaries, see _fetch_summaries_after."""
+        return await self._fetch_summaries_after(
+            self._summaries_query(cycle_id, status), after, limit
+        )
+
+    async def list_summaries_by_reviewer(
+        self, reviewer_id: uuid.UUID, offset: int = 0, limit: int = None
+    ):
+        """
+        Returns summaries of the applications assigned to a reviewer. Only the
+        summary columns are selected, so essay bodies are never loaded.
+        """
+        query = self._reviewer_summaries_query(reviewer_id)
+        if limit is not None:
+            query = query.offset(offset).limit(limit)
+        return await self._fetch_summaries(query)
+
+    async def list_summaries_by_reviewer_after(
+        self,
+        reviewer_id: uuid.UUID,
+        after: Optional[Tuple[Optional[datetime], uuid.UUID]],
+        limit: int,
+    ):
+        """Keyset variant of list_summaries_by_reviewer."""
+        return await self._fetch_summaries_after(
+            self._reviewer_summaries_query(reviewer_id), after, limit
+        )
+
+    async def count_by_reviewer(self, reviewer_id: uuid.UUID):
+        return await self.db.scalar(
+            select(func.count(ApplicationModel.id)).where(
+                ApplicationModel.assigned_reviewer_id == reviewer_id
+            )
+        )
+
+    async def count_by_cycle(self, cycle_id: int, status: str = None):
+        query = select(func.count(ApplicationModel.id)).where(
+            ApplicationModel.cycle_id == cycle_id
+        )
+        if status:
+            query = query.where(ApplicationModel.status == status)
+        return await self.db.scalar(query)
+
+    async def count_all(self):
+        return await self.db.scalar(
+            select(func.count()).select_from(ApplicationModel)
+        )
+
+    async def count_by_status(self, status: str):
+        return await self.db.scalar(
+            select(func.count(ApplicationModel.id)).where(
+                ApplicationModel.status == status
+            )
+        )
+
+    async def get_status_distribution(self):
+        """Returns a list of tuples (status, count)"""
+        result = await self.db.execute(
+            select(
+                ApplicationModel.status, func.count(ApplicationModel.status)
+            ).group_by(ApplicationModel.status)
+        )
+        return result.all()
+
+    async def get_school_distribution(self):
+        """Returns a list of tuples (school, count)"""
+        result = await self.db.execute(
+            select(ApplicationModel.school, func.count(ApplicationModel.school))
+            .group_by(ApplicationModel.school)
+            .order_by(func.count(ApplicationModel.school).desc())
+        )
+        return result.all()
+
+    async def get_country_distribution(self):
+        """Returns a list of tuples (country, count)"""
+        result = await self.db.execute(
+            select(ApplicationModel.country, func.count(ApplicationModel.country))
+            .group_by(ApplicationModel.country)
+            .order_by(func.count(ApplicationModel.country).desc())
+        )
+        return result.all()
+
+    async def get_average_review_time(self, cycle_id: int = None):
+        """
+        Calculates the average review time in days for finalized applications,
+        from the durations stored when each decision was made.
+        """
+        avg_seconds, _ = await self.get_review_time_stats(cycle_id, percentiles=())
+        if avg_seconds is None:
+            return 0.0
+
+        # Convert average seconds to days
+        return avg_seconds / (24 * 60 * 60)
+
+    async def get_analytics_summary(self, cycle_id: int = None):
+        """
+        Returns the totals and distributions behind /admin/analytics/. Counts
+        come from application_stats, so the cost is per bucket rather than
+        per application; only the review time still reads applications.
+        """
+        counts = await self.stats.get_counts(cycle_id)
+        average, percentiles = await self.get_review_time_stats(cycle_id)
+
+        def by_count(dimension):
+            buckets = counts.get(dimension, {})
+            return dict(sorted(buckets.items(), key=lambda kv: kv[1], reverse=True))
+
+        status_counts = counts.get("status", {})
+        return ApplicationAnalytics(
+            total=sum(status_counts.values()),
+            status_counts=status_counts,
+            school_counts=by_count("school"),
+            country_counts=by_count("country"),
+            average_review_seconds=average,
+            review_seconds_percentiles=percentiles,
+        )
+
+    @staticmethod
+    def _decided(cycle_id: int = None):
+        conditions = [
+            ApplicationModel.status.in_(FINAL_STATUSES),
+            ApplicationModel.review_duration_seconds.isnot(None),
+        ]
+        if cycle_id is not None:
+            conditions.append(ApplicationModel.cycle_id == cycle_id)
+        return conditions
+
+    async def get_review_time_stats(
+        self, cycle_id: int = None, percentiles: Sequence[int] = (50, 90, 99)
+    ):
+        """
+        Returns (average seconds or None, {"p50": seconds, ...}) for
+        time-to-decision in one statement. Percentiles use the nearest-rank
+        method: the value at rank ceil(p / 100 * n) of the sorted durations.
+
+        Postgres computes them with percentile_disc, which is nearest-rank.
+        SQLite has no ordered-set aggregates, so there the durations are
+        read in index order in one query and ranked here.
+        """
+        duration = ApplicationModel.review_duration_seconds
+        decided = self._decided(cycle_id)
+        if self.db.bind.dialect.name == "postgresql":
+            fractions = literal([p / 100 for p in percentiles], postgresql.ARRAY(Float))
+            result = await self.db.execute(
+                select(
+                    func.avg(duration),
+                    # One value per fraction, as an array of durations
+                    type_coerce(
+                        func.percentile_disc(fractions).within_group(duration),
+                        postgresql.ARRAY(Integer),
+                    ),
+                ).where(*decided)
+            )
+            average, values = result.one()
+        else:
+            result = await self.db.scalars(
+                select(duration).where(*decided).order_by(duration)
+            )
+            durations = result.all()
+            if not durations:
+                return None, {}
+            average = sum(durations) / len(durations)
+            values = [
+                durations[max(math.ceil(p / 100 * len(durations)), 1) - 1]
+                for p in percentiles
+            ]
+        if average is None:
+            return None, {}
+        return float(average), {
+            f"p{p}": float(value) for p, value in zip(percentiles, values)
+        }
+
+    async def list_by_status(self, status: str):
+        return []  # Not needed for applicant workflow
+
+    async def _lock_state(self, application_id: uuid.UUID):
+        # Row-locked read of what an UPDATE needs to know about the old row
+        result = await self.db.execute(
+            select(ApplicationModel.status, ApplicationModel.submitted_at)
+            .where(ApplicationModel.id == application_id)
+            .with_for_update()
+        )
+        return result.first()
+
+    async def _update_summary(
+        self, application_id: uuid.UUID, old_status: str = None, **values
+    ):
+        # UPDATE ... RETURNING, so the row is never loaded into the session.
+        # The old status is read under a row lock first for the counters.
+        if old_status is None:
+            state = await self._lock_state(application_id)
+            if state is None:
+                return None
+            old_status = state.status
+        result = await self.db.execute(
+            update(ApplicationModel)
+            .where(ApplicationModel.id == application_id)
+            .values(**values)
+            .returning(*self._SUMMARY_COLUMNS)
+        )
+        row = result.first()
+        await self._apply_stats(
+            row.cycle_id, self._stat_changes({"status": old_status}, {"status": row.status})
+        )
+        return self._row_to_summary(row)
+
+    async def assign_reviewer(self, application_id: uuid.UUID, reviewer_id: uuid.UUID):
+        return await self._update_summary(
+            application_id,
+            assigned_reviewer_id=reviewer_id,
+            status="pending_review",
+        )
+
+    async def open_load_by_reviewer(self, reviewer_ids: Sequence[uuid.UUID]):
+        """Counts each reviewer's assigned applications that are still undecided."""
+        result = await self.db.execute(
+            select(ApplicationModel.assigned_reviewer_id, func.count())
+            .where(
+                ApplicationModel.assigned_reviewer_id.in_(reviewer_ids),
+                ApplicationModel.status.notin_(FINAL_STATUSES),
+            )
+            .group_by(ApplicationModel.assigned_reviewer_id)
+        )
+        load = {reviewer_id: 0 for reviewer_id in reviewer_ids}
+        load.update(result.all())
+        return load
+
+    @staticmethod
+    def balance_assignments(
+        application_ids: Sequence[uuid.UUID], load: Dict[uuid.UUID, int]
+    ) -> Dict[uuid.UUID, List[uuid.UUID]]:
+        """
+        Hands each application, in order, to the reviewer with the fewest
+        open applications at that point. Ties go to the reviewer listed
+        first in `load`, so the result is deterministic.
+        """
+        heap = [
+            (count, i, reviewer_id)
+            for i, (reviewer_id, count) in enumerate(load.items())
+        ]
+        heapq.heapify(heap)
+        assignments = {reviewer_id: [] for reviewer_id in load}
+        for application_id in application_ids:
+            count, i, reviewer_id = heap[0]
+            assignments[reviewer_id].append(application_id)
+            heapq.heapreplace(heap, (count + 1, i, reviewer_id))
+        return assignments
+
+    async def auto_assign_reviewers(
+        self,
+        cycle_id: int,
+        reviewer_ids: Sequence[uuid.UUID],
+        status: str = None,
+    ):
+        """
+        Assigns every submitted, unassigned, undecided application in the
+        cycle (optionally only those in `status`) across `reviewer_ids`,
+        balancing by each reviewer's open load. Runs one UPDATE per reviewer
+        and chunk and flushes them with the counter changes, so they commit
+        together.
+
+        Returns (assignments, load): the application ids given to each
+        reviewer and each reviewer's open load before the run.
+        """
+        query = (
+            select(ApplicationModel.id, ApplicationModel.status)
+            .where(
+                ApplicationModel.cycle_id == cycle_id,
+                ApplicationModel.assigned_reviewer_id.is_(None),
+                # Drafts stay with the applicant: assigning one would move it
+                # to pending_review and lock them out of editing it
+                ApplicationModel.status.notin_((DRAFT_STATUS, *FINAL_STATUSES)),
+            )
+            .order_by(ApplicationModel.submitted_at, ApplicationModel.id)
+            # A concurrent run leaves rows this one has claimed alone
+            .with_for_update(skip_locked=True)
+        )
+        if status:
+            query = query.where(ApplicationModel.status == status)
+        rows = (await self.db.execute(query)).all()
+
+        load = await self.open_load_by_reviewer(reviewer_ids)
+        assignments = self.balance_assignments([row.id for row in rows], load)
+
+        for reviewer_id, application_ids in assignments.items():
+            for ids in chunked(application_ids):
+                await self.db.execute(
+                    update(ApplicationModel)
+                    .where(ApplicationModel.id.in_(ids))
+                    .values(assigned_reviewer_id=reviewer_id, status="pending_review")
+                )
+
+        # Assigning moves an application to pending_review, as assign_reviewer does
+        changes = self._status_moves(Counter(row.status for row in rows), "pending_review")
+        await self._apply_stats(cycle_id, changes)
+        return assignments, load
+
+    async def finalize_decision(
+        self, application_id: uuid.UUID, status: str, decision_notes: str
+    ):
+        state = await self._lock_state(application_id)
+        if state is None:
+            return None
+        decided_at = datetime.now(timezone.utc)
+        return await self._update_summary(
+            application_id,
+            state.status,
+            status=status,
+            decision_notes=decision_notes,
+            decided_at=decided_at,
+            review_duration_seconds=review_duration_seconds(
+                state.submitted_at, decided_at
+            ),
+        )
+
+    def _export_query(self, cycle_id: int):
+        applicant = aliased(UserModel)
+        reviewer = aliased(UserModel)
+        return (
+            select(
+                ApplicationModel.id,
+                applicant.full_name.label("applicant_name"),
+                applicant.email.label("applicant_email"),
+                ApplicationModel.status,
+                ApplicationModel.school,
+                ApplicationModel.student_id,
+                ApplicationModel.country,
+                ApplicationModel.degree,
+                ApplicationModel.leetcode_handle,
+                ApplicationModel.codeforces_handle,
+                ApplicationModel.resume_url,
+                ApplicationModel.essay_why_a2sv,
+                ApplicationModel.essay_about_you,
+                ApplicationModel.submitted_at,
+                ApplicationModel.decided_at,
+                ApplicationModel.decision_notes,
+                reviewer.full_name.label("reviewer_name"),
+                ReviewModel.activity_check_notes,
+                ReviewModel.resume_score,
+                ReviewModel.essay_why_a2sv_score,
+                ReviewModel.essay_about_you_score,
+                ReviewModel.technical_interview_score,
+                ReviewModel.behavioral_interview_score,
+                case(
+                    (ReviewModel.id.is_(None), None),
+                    else_=self._review_total_score(),
+                ).label("total_score"),
+                ReviewModel.interview_notes,
+            )
+            .outerjoin(applicant, applicant.id == ApplicationModel.applicant_id)
+            .outerjoin(reviewer, reviewer.id == ApplicationModel.assigned_reviewer_id)
+            .outerjoin(ReviewModel, ReviewModel.application_id == ApplicationModel.id)
+            .where(ApplicationModel.cycle_id == cycle_id)
+            .order_by(ApplicationModel.submitted_at, ApplicationModel.id)
+        )
+
+    async def stream_export(self, cycle_id: int):
+        """
+        Every application in the cycle with its applicant, reviewer and
+        review scores, read through a server-side cursor EXPORT_BATCH_SIZE
+        rows at a time. Returns (column names, async iterable of rows); the
+        session must stay open until the rows have been consumed.
+        """
+        result = await self.db.stream(
+            self._export_query(cycle_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        return list(result.keys()), result
+
+    def _seconds_since_submitted(self, moment: datetime):
+        """SQL for review_duration_seconds(submitted_at, moment), per row."""
+        moment = literal(moment, ApplicationModel.decided_at.type)
+        if self.db.bind.dialect.name == "postgresql":
+            elapsed = func.extract("epoch", moment - ApplicationModel.submitted_at)
+        else:
+            elapsed = (
+                func.julianday(moment) - func.julianday(ApplicationModel.submitted_at)
+            ) * 86400
+        return case((elapsed < 0, 0), else_=cast(func.floor(elapsed), Integer))
+
+    @staticmethod
+    def _review_total_score():
+        """A review's scores summed, with unscored parts counting as zero."""
+        return sum(
+            func.coalesce(column, 0)
+            for column in (
+                ReviewModel.resume_score,
+                ReviewModel.essay_why_a2sv_score,
+                ReviewModel.essay_about_you_score,
+                ReviewModel.technical_interview_score,
+                ReviewModel.behavioral_interview_score,
+            )
+        )
+
+    async def bulk_finalize_decisions(
+        self,
+        status: str,
+        decision_notes: Optional[str] = None,
+        application_ids: Optional[Sequence[uuid.UUID]] = None,
+        cycle_id: Optional[int] = None,
+        min_score: Optional[float] = None,
+    ):
+        """
+        Decides many applications at once: either the given ids, or every
+        undecided application in `cycle_id` whose review scores add up to
+        at least `min_score`. Only submitted, undecided applications are
+        decided; drafts and earlier decisions are left as they are.
+
+        The matching rows' old statuses are read under a row lock for the
+        counters, then each chunk of ids is decided with one UPDATE ...
+        RETURNING; decided_at and review_duration_seconds are computed in
+        the statement.
+
+        Returns ({application_id: previous status} for the decided rows,
+        {application_id: status} for the given ids that were left alone).
+        """
+        query = select(
+            ApplicationModel.id, ApplicationModel.cycle_id, ApplicationModel.status
+        ).with_for_update()
+        skipped = {}
+        if application_ids is not None:
+            candidates = []
+            for ids in chunked(list(application_ids)):
+                result = await self.db.execute(
+                    query.where(ApplicationModel.id.in_(ids))
+                )
+                for row in result.all():
+                    if row.status in NOT_DECIDABLE:
+                        skipped[row.id] = row.status
+                    else:
+                        candidates.append(row)
+        else:
+            scored = select(ReviewModel.application_id).where(
+                self._review_total_score() >= min_score
+            )
+            result = await self.db.execute(
+                query.where(
+                    ApplicationModel.cycle_id == cycle_id,
+                    ApplicationModel.status.notin_(NOT_DECIDABLE),
+                    ApplicationModel.id.in_(scored),
+                )
+            )
+            candidates = result.all()
+
+        decided_at = datetime.now(timezone.utc)
+        decided = []
+        for rows in chunked(candidates):
+            result = await self.db.execute(
+                update(ApplicationModel)
+                .where(
+                    ApplicationModel.id.in_([row.id for row in rows]),
+                    ApplicationModel.status.notin_(NOT_DECIDABLE),
+                )
+                .values(
+                    status=status,
+                    decision_notes=decision_notes,
+                    decided_at=decided_at,
+                    review_duration_seconds=self._seconds_since_submitted(decided_at),
+                )
+                .returning(ApplicationModel.id)
+            )
+            decided.extend(result.scalars().all())
+
+        previous = {row.id: row for row in candidates}
+        moved = {}
+        for application_id in decided:
+            row = previous[application_id]
+            moved.setdefault(row.cycle_id, Counter())[row.status] += 1
+        await self._apply_cycle_stats(
+            {cycle: self._status_moves(counts, status) for cycle, counts in moved.items()}
+        )
+        return {
+            application_id: previous[application_id].status for application_id in decided
+        }, skipped
+
+    async def list_all(self):
+        return []  # Not needed for applicant workflow
+
+
+class ApplicationStatRepository(IApplicationStatRepository):
+    """Per-cycle application counters, see app.models.application_stat."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(self, cycle_id: int, changes):
+        """
+        Adds each (dimension, bucket, delta) in `changes` to the cycle's
+        counters. Runs in the caller's transaction and does not commit.
+        """
+        for dimension, bucket, delta in changes:
+            stmt = dialect_insert(self.db, ApplicationStatModel).values(
+                cycle_id=cycle_id, dimension=dimension, bucket=bucket, count=delta
+            )
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["cycle_id", "dimension", "bucket"],
+                    set_={"count": ApplicationStatModel.count + stmt.excluded.count},
+                )
+            )
+
+    async def get_counts(self, cycle_id: int = None):
+        """Returns {dimension: {bucket: count}}, summed over cycles unless one is given."""
+        query = select(
+            ApplicationStatModel.dimension,
+            ApplicationStatModel.bucket,
+            func.sum(ApplicationStatModel.count).label("count"),
+        ).group_by(ApplicationStatModel.dimension, ApplicationStatModel.bucket)
+        if cycle_id is not None:
+            query = query.where(ApplicationStatModel.cycle_id == cycle_id)
+
+        counts = {}
+        for row in (await self.db.execute(query)).all():
+            if row.count:
+                counts.setdefault(row.dimension, {})[row.bucket] = int(row.count)
+        return counts
+
+    async def get_all(self):
+        """Returns the stored counters as {(cycle_id, dimension, bucket): count}."""
+        result = await self.db.execute(select(ApplicationStatModel))
+        return {
+            (s.cycle_id, s.dimension, s.bucket): s.count for s in result.scalars().all()
+        }
+
+    async def recount(self):
+        """Counts applications from scratch, in the same shape as get_all."""
+        counts = {}
+        for dimension in STAT_DIMENSIONS:
+            column = getattr(ApplicationModel, dimension)
+            result = await self.db.execute(
+                select(ApplicationModel.cycle_id, column, func.count()).group_by(
+                    ApplicationModel.cycle_id, column
+                )
+            )
+            for cycle_id, bucket, count in result.all():
+                counts[(cycle_id, dimension, bucket)] = count
+        return counts
+
+    async def replace_all(self, counts):
+        """Overwrites every counter with `counts`. Does not commit."""
+        await self.db.execute(delete(ApplicationStatModel))
+        if counts:
+            await self.db.execute(
+                ApplicationStatModel.__table__.insert(),
+                [
+                    dict(cycle_id=c, dimension=d, bucket=b, count=n)
+                    for (c, d, b), n in counts.items()
+                ],
+            )
+
+
+class TokenVersionRepository(ITokenVersionRepository):
+    """Access-token versions, see app.models.token_version."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, user_id: uuid.UUID) -> int:
+        result = await self.db.execute(
+            select(TokenVersionModel.version).where(TokenVersionModel.user_id == user_id)
+        )
+        return result.scalar() or 0
+
+    async def bump(self, user_id: uuid.UUID) -> int:
+        """
+        Revokes the user's access tokens issued so far and returns the new
+        version. Runs in the caller's transaction; this worker's token
+        version table is updated once it commits.
+        """
+        stmt = dialect_insert(self.db, TokenVersionModel).values(
+            user_id=user_id, version=1
+        )
+        result = await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={"version": TokenVersionModel.version + 1, "updated_at": func.now()},
+            ).returning(TokenVersionModel.version)
+        )
+        version = result.scalar_one()
+        after_commit(self.db, lambda: token_versions.set(user_id, version))
+        return version
+
+    async def get_all(self) -> Dict[uuid.UUID, int]:
+        result = await self.db.execute(
+            select(TokenVersionModel.user_id, TokenVersionModel.version)
+        )
+        return dict(result.all())
+
+
+class EmailOutboxRepository(IEmailOutboxRepository):
+    """Queued outbound email, see app.models.email_outbox."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, recipient: str, subject: str, html_body: str) -> int:
+        """Queues a message in the caller's transaction; it is sent once that commits."""
+        result = await self.db.execute(
+            EmailOutboxModel.__table__.insert()
+            .values(
+                recipient=recipient,
+                subject=subject,
+                html_body=html_body,
+                status="pending",
+                attempts=0,
+                next_attempt_at=datetime.now(timezone.utc),
+            )
+            .returning(EmailOutboxModel.id)
+        )
+        return result.scalar_one()
+
+    async def claim_due(self, limit: int, lease_seconds: int):
+        """
+        Takes up to `limit` messages that are due and counts an attempt for
+        each. A claimed message isn't due again for `lease_seconds`, so if
+        the worker dies before recording the outcome it is retried then.
+        Commit before sending so other workers skip the claimed rows.
+        """
+        now = datetime.now(timezone.utc)
+        due = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == "pending",
+                EmailOutboxModel.next_attempt_at <= now,
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            # Concurrent workers each take different rows
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due.scalar_subquery()))
+            .values(
+                attempts=EmailOutboxModel.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(*OUTBOX_EMAIL.columns)
+        )
+        return [OUTBOX_EMAIL.from_row(row) for row in result.all()]
+
+    async def mark_sent(self, email_id: int):
+        await self.db.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id == email_id)
+            .values(status="sent", sent_at=datetime.now(timezone.utc), last_error=None)
+        )
+
+    async def mark_failed(self, email_id: int, error: str, retry_at: Optional[datetime]):
+        """Records a failed attempt; without `retry_at` the message is given up on."""
+        values = {"last_error": error}
+        if retry_at is None:
+            values["status"] = "failed"
+        else:
+            values["next_attempt_at"] = retry_at
+        await self.db.execute(
+            update(EmailOutboxModel).where(EmailOutboxModel.id == email_id).values(**values)
+        )
+
+
+class RoleRepository(IRoleRepository):
+    """AsyncSession implementation of IRoleRepository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _fetch(self, query):
+        result = await self.db.execute(query)
+        return [ROLE.from_row(row) for row in result.all()]
+
+    async def get_by_name(self, name: str):
+        roles = await self._fetch(select(*ROLE.columns).where(RoleModel.name == name))
+        return roles[0] if roles else None
+
+    async def get_by_id(self, role_id: int):
+        roles = await self._fetch(select(*ROLE.columns).where(RoleModel.id == role_id))
+        return roles[0] if roles else None
+
+    async def list_all(self):
+        return await self._fetch(select(*ROLE.columns))
+
+
+class ApplicationCycleRepository(IApplicationCycleRepository):
+    """AsyncSession implementation of IApplicationCycleRepository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def _to_entity(cycle: ApplicationCycleModel) -> ApplicationCycle:
+        return APPLICATION_CYCLE.from_object(cycle)
+
+    async def _get_model(self, cycle_id: int):
+        result = await self.db.execute(
+            select(ApplicationCycleModel).where(ApplicationCycleModel.id == cycle_id)
+        )
+        return result.scalars().first()
+
+    async def _fetch(self, query):
+        result = await self.db.execute(query)
+        return [APPLICATION_CYCLE.from_row(row) for row in result.all()]
+
+    async def _fetch_one(self, condition):
+        cycles = await self._fetch(
+            select(*APPLICATION_CYCLE.columns).where(condition).limit(1)
+        )
+        return cycles[0] if cycles else None
+
+    async def get_active(self):
+        return await self._fetch_one(ApplicationCycleModel.is_active == True)
+
+    async def get_by_id(self, cycle_id: int):
+        return await self._fetch_one(ApplicationCycleModel.id == cycle_id)
+
+    async def get_by_name(self, name: str):
+        return await self._fetch_one(ApplicationCycleModel.name == name)
+
+    async def create(self, cycle: ApplicationCycle):
+        db_cycle = ApplicationCycleModel(
+            name=cycle.name,
+            start_date=cycle.start_date,
+            end_date=cycle.end_date,
+            is_active=cycle.is_active,
+            description=cycle.description,
+        )
+        self.db.add(db_cycle)
+        await self.db.flush()
+        await self.db.refresh(db_cycle)
+        return self._to_entity(db_cycle)
+
+    async def activate(self, cycle_id: int):
+        cycle = await self._get_model(cycle_id)
+        if not cycle:
+            return None
+
+        cycle.is_active = True
+        await self.db.flush()
+        await self.db.refresh(cycle)
+        return self._to_entity(cycle)
+
+    async def deactivate(self, cycle_id: int):
+        """Deactivates a single application cycle."""
+        cycle = await self._get_model(cycle_id)
+        if not cycle:
+            return None
+
+        cycle.is_active = False
+        await self.db.flush()
+        await self.db.refresh(cycle)
+        return self._to_entity(cycle)
+
+    async def list_all(
+        self, offset: int = 0, limit: int = None, is_active: bool = None
+    ):
+        query = select(*APPLICATION_CYCLE.columns).order_by(
+            ApplicationCycleModel.created_at, ApplicationCycleModel.id
+        )
+        if is_active is not None:
+            query = query.where(ApplicationCycleModel.is_active == is_active)
+
+        if limit is not None:
+            query = query.offset(offset).limit(limit)
+        return await self._fetch(query)
+
+    async def list_after(self, after: Optional[Tuple[datetime, int]], limit: int):
+        """Keyset page of cycles ordered by (created_at, id), starting after `after`."""
+        query = select(*APPLICATION_CYCLE.columns).order_by(
+            ApplicationCycleModel.created_at, ApplicationCycleModel.id
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(ApplicationCycleModel.created_at, ApplicationCycleModel.id)
+                > after
+            )
+        return await self._fetch(query.limit(limit))
+
+    async def count_all(self):
+        return await self.db.scalar(
+            select(func.count()).select_from(ApplicationCycleModel)
+        )
+
+    async def update(self, cycle_id: int, **kwargs):
+        cycle = await self._get_model(cycle_id)
+        if not cycle:
+            return None
+        for key, value in kwargs.items():
+            if hasattr(cycle, key) and value is not None:
+                setattr(cycle, key, value)
+        await self.db.flush()
+        await self.db.refresh(cycle)
+        return self._to_entity(cycle)
+
+    async def delete(self, cycle_id: int):
+        cycle = await self._get_model(cycle_id)
+        if not cycle:
+            return False
+        await self.db.delete(cycle)
+        await self.db.flush()
+        return True
+
+
+class ReviewRepository(IReviewRepository):
+    """AsyncSession implementation of IReviewRepository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_application_id(self, application_id: uuid.UUID):
+        result = await self.db.execute(
+            select(*REVIEW.columns).where(ReviewModel.application_id == application_id)
+        )
+        row = result.first()
+        return REVIEW.from_row(row) if row else None
+
+    async def create_or_update(
+        self, application_id: uuid.UUID, reviewer_id: uuid.UUID, data: dict
+    ):
+        """
+        Saves the application's review with a single INSERT ... ON CONFLICT
+        (application_id) DO UPDATE ... RETURNING, so concurrent saves can't
+        race into the unique constraint. On an existing review only the
+        fields in `data` change.
+        """
+        values = {**data, "reviewer_id": reviewer_id}
+        result = await self.db.execute(
+            dialect_insert(self.db, ReviewModel)
+            .values(id=uuid.uuid4(), application_id=application_id, **values)
+            .on_conflict_do_update(
+                index_elements=[ReviewModel.application_id],
+                # onupdate= isn't applied to the conflict branch
+                set_={**values, "updated_at": func.now()},
+            )
+            .returning(*REVIEW.columns)
+        )
+        return REVIEW.from_row(result.one())
+
+    async def list_by_reviewer(self, reviewer_id: uuid.UUID):
+        result = await self.db.execute(
+            select(*REVIEW.columns).where(ReviewModel.reviewer_id == reviewer_id)
+        )
+        return [REVIEW.from_row(row) for row in result.all()]
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.domain.entities import User, Role, ApplicationCycle, Application, Review
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from app.domain.entities import User, Role, ApplicationCycle, Application, ApplicationSummary, Review, OutboxEmail
 import uuid
 
 class IUserRepository(ABC):
@@ -41,16 +42,42 @@ class IApplicationRepository(ABC):
     @abstractmethod
     def create(self, application: Application) -> Application: ...
     @abstractmethod
-    def list_by_reviewer(self, reviewer_id: uuid.UUID, offset: int = 0, limit: int = None) -> List[Application]: ...
+    def list_by_reviewer(self, reviewer_id: uuid.UUID, offset: int = 0, limit: int = None) -> List[ApplicationSummary]: ...
     @abstractmethod
     def list_by_status(self, status: str) -> List[Application]: ...
     @abstractmethod
-    def assign_reviewer(self, application_id: uuid.UUID, reviewer_id: uuid.UUID) -> Application: ...
+    def assign_reviewer(self, application_id: uuid.UUID, reviewer_id: uuid.UUID) -> Optional[ApplicationSummary]: ...
     @abstractmethod
-    def finalize_decision(self, application_id: uuid.UUID, status: str, decision_notes: str) -> Application: ...
+    def finalize_decision(self, application_id: uuid.UUID, status: str, decision_notes: str) -> Optional[ApplicationSummary]: ...
     @abstractmethod
     def list_all(self) -> List[Application]: ...
 
+class IApplicationStatRepository(ABC):
+    @abstractmethod
+    def apply(self, cycle_id: int, changes: List[Tuple[str, str, int]]) -> None: ...
+    @abstractmethod
+    def get_counts(self, cycle_id: Optional[int] = None) -> Dict[str, Dict[str, int]]: ...
+    @abstractmethod
+    def recount(self) -> Dict[Tuple[int, str, str], int]: ...
+
+class ITokenVersionRepository(ABC):
+    @abstractmethod
+    def get(self, user_id: uuid.UUID) -> int: ...
+    @abstractmethod
+    def bump(self, user_id: uuid.UUID) -> int: ...
+    @abstractmethod
+    def get_all(self) -> Dict[uuid.UUID, int]: ...
+
+class IEmailOutboxRepository(ABC):
+    @abstractmethod
+    def enqueue(self, recipient: str, subject: str, html_body: str) -> int: ...
+    @abstractmethod
+    def claim_due(self, limit: int, lease_seconds: int) -> List[OutboxEmail]: ...
+    @abstractmethod
+    def mark_sent(self, email_id: int) -> None: ...
+    @abstractmethod
+    def mark_failed(self, email_id: int, error: str, retry_at: Optional[datetime]) -> None: ...
+
 class IReviewRepository(ABC):
     @abstractmethod
     def get_by_application_id(self, application_id: uuid.UUID) -> Optional[Review]: ...
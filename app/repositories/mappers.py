@@ -0,0 +1,89 @@
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Optional
+from app.domain.entities import (
+    User,
+    Principal,
+    Role,
+    Application,
+    ApplicationCycle,
+    ApplicationSummary,
+    Review,
+    OutboxEmail,
+)
+from app.models.user import User as UserModel
+from app.models.role import Role as RoleModel
+from app.models.application import Application as ApplicationModel
+from app.models.application_cycle import ApplicationCycle as ApplicationCycleModel
+from app.models.review import Review as ReviewModel
+from app.models.email_outbox import EmailOutbox as EmailOutboxModel
+
+
+class EntityMapper:
+    """
+    Builds one kind of domain entity, either from a Core result row or from
+    any object exposing the entity's fields as attributes (an ORM instance,
+    a Row selected with other columns).
+
+    `columns` is the model's columns in entity field order. Rows selected
+    with exactly those columns are passed to the entity constructor
+    positionally, so read paths skip the ORM identity map and the
+    per-field attribute lookups.
+    """
+
+    def __init__(
+        self,
+        entity_cls,
+        model=None,
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ):
+        self.entity_cls = entity_cls
+        self.fields = tuple(f.name for f in fields(entity_cls))
+        self._defaults = {
+            f.name: f.default for f in fields(entity_cls) if f.default is not MISSING
+        }
+        self.columns = (
+            tuple(getattr(model, name) for name in self.fields) if model else ()
+        )
+        converters = converters or {}
+        self._converters = tuple(
+            (self.fields.index(name), name, fn) for name, fn in converters.items()
+        )
+
+    def from_row(self, row):
+        """Builds the entity from a row selected with `self.columns`."""
+        if not self._converters:
+            return self.entity_cls(*row)
+        values = list(row)
+        for index, _, convert in self._converters:
+            values[index] = convert(values[index])
+        return self.entity_cls(*values)
+
+    def from_object(self, obj):
+        """
+        Builds the entity by attribute name. Fields the object lacks take
+        their dataclass default, or None.
+        """
+        values = [getattr(obj, name, self._defaults.get(name)) for name in self.fields]
+        for index, _, convert in self._converters:
+            values[index] = convert(values[index])
+        return self.entity_cls(*values)
+
+    def values(self, entity) -> dict:
+        """Returns the entity's fields as a dict, e.g. to copy onto a model."""
+        return {name: getattr(entity, name) for name in self.fields}
+
+
+# users.is_active is stored as 1/0
+USER = EntityMapper(User, UserModel, converters={"is_active": lambda v: v == 1})
+PRINCIPAL = EntityMapper(
+    Principal, UserModel, converters={"is_active": lambda v: v == 1}
+)
+ROLE = EntityMapper(Role, RoleModel)
+APPLICATION_CYCLE = EntityMapper(ApplicationCycle, ApplicationCycleModel)
+APPLICATION = EntityMapper(Application, ApplicationModel)
+REVIEW = EntityMapper(Review, ReviewModel)
+OUTBOX_EMAIL = EntityMapper(OutboxEmail, EmailOutboxModel)
+# Summaries come from joined selects with labelled columns, not one model
+APPLICATION_SUMMARY = EntityMapper(
+    ApplicationSummary, converters={"applicant_name": lambda v: v or ""}
+)
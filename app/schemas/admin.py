@@ -19,6 +19,18 @@ class AdminUserResponse(BaseModel):
     is_active: bool
 
 
+class AdminImportUserError(BaseModel):
+    row: int  # Line number in the uploaded file
+    email: str | None = None
+    error: str
+
+
+class AdminImportUsersResponse(BaseModel):
+    created_count: int
+    error_count: int
+    errors: List[AdminImportUserError]
+
+
 class AdminCycleCreateRequest(BaseModel):
     name: str
     start_date: date
@@ -56,12 +68,45 @@ class AdminListUsersResponse(BaseModel):
     total_count: int
     page: int
     limit: int
+    next_cursor: str | None = None
 
 
 class AnalyticsResponse(BaseModel):
     total_applicants: int
     acceptance_rate: float
     average_review_time_days: float
+    # Time-to-decision percentiles, e.g. {"p50": 3.5, "p90": 9.0, "p99": 14.2}
+    review_time_percentiles_days: Dict[str, float] = {}
     application_funnel: Dict[str, int]
     school_distribution: Dict[str, int]
     country_distribution: Dict[str, int]
+
+
+class DatabasePoolStats(BaseModel):
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    connects_total: int
+    checkouts_total: int
+    checkins_total: int
+    invalidations_total: int
+    checkout_timeouts_total: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class DatabasePoolResponse(BaseModel):
+    worker_pid: int
+    pools: Dict[str, DatabasePoolStats]
+
+
+class AdminRoleResponse(BaseModel):
+    id: int
+    name: str
+
+
+class AdminRolesResponse(BaseModel):
+    worker_pid: int
+    roles: List[AdminRoleResponse]
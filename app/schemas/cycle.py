@@ -18,3 +18,4 @@ class PublicCycleListResponse(BaseModel):
     total_count: int
     page: int
     limit: int
+    next_cursor: str | None = None
@@ -63,3 +63,4 @@ class ReviewListResponse(BaseModel):
     total_count: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
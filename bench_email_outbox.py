@@ -0,0 +1,162 @@
+"""
+Benchmark for outbound email against a local aiosmtpd server, so it runs offline.
+
+Sends the same messages three ways: a new SMTP connection per message (how
+email was sent before the outbox), the outbox's SMTPSender reusing one
+connection per task, and end to end through the email_outbox table and its
+worker tasks. --ehlo-delay makes the server slow down each handshake, to
+stand in for the round trips and TLS setup of a real SMTP provider.
+
+    pip install aiosmtpd
+    python bench_email_outbox.py --messages 500 --workers 4 --ehlo-delay 50
+"""
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+import time
+from email.message import EmailMessage
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    raise SystemExit("This benchmark needs aiosmtpd: pip install aiosmtpd")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+PORT = free_port()
+
+# Point the app at the local server and a throwaway database before it is
+# imported; settings are read once, at import.
+os.environ.update(
+    MAIL_SERVER="127.0.0.1",
+    MAIL_PORT=str(PORT),
+    MAIL_STARTTLS="false",
+    MAIL_SSL_TLS="false",
+    MAIL_USERNAME="",
+)
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+os.environ.setdefault("MAIL_PASSWORD", "bench")
+os.environ.setdefault("MAIL_FROM", "bench@example.com")
+
+import aiosmtplib
+from app.core import email as app_email
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, Base, async_engine, engine
+from app.repositories.async_impl import EmailOutboxRepository
+
+BODY = "<p>" + "Reset your password. " * 40 + "</p>"
+
+
+class CountingHandler:
+    def __init__(self, ehlo_delay: float):
+        self.ehlo_delay = ehlo_delay
+        self.received = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        await asyncio.sleep(self.ehlo_delay)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+async def connection_per_message(count: int, workers: int):
+    gate = asyncio.Semaphore(workers)
+
+    async def send(i: int):
+        message = EmailMessage()
+        message["From"] = settings.MAIL_FROM
+        message["To"] = f"user{i}@example.com"
+        message["Subject"] = "Reset Your Password"
+        message.set_content(BODY, subtype="html")
+        async with gate:
+            await aiosmtplib.send(
+                message, hostname=settings.MAIL_SERVER, port=settings.MAIL_PORT
+            )
+
+    await asyncio.gather(*(send(i) for i in range(count)))
+
+
+async def reused_connections(count: int, workers: int):
+    queue = asyncio.Queue()
+    for i in range(count):
+        queue.put_nowait(i)
+
+    async def drain():
+        sender = app_email.SMTPSender()
+        try:
+            while not queue.empty():
+                i = queue.get_nowait()
+                await sender.send(f"user{i}@example.com", "Reset Your Password", BODY)
+        finally:
+            await sender.close()
+
+    await asyncio.gather(*(drain() for _ in range(workers)))
+
+
+async def through_outbox(count: int, workers: int, handler: CountingHandler):
+    async with AsyncSessionLocal() as db:
+        outbox = EmailOutboxRepository(db)
+        for i in range(count):
+            await outbox.enqueue(f"user{i}@example.com", "Reset Your Password", BODY)
+        await db.commit()
+
+    target = handler.received + count
+    settings.EMAIL_OUTBOX_WORKERS = workers
+    app_email.start_outbox_workers()
+    while handler.received < target:
+        await asyncio.sleep(0.01)
+    await app_email.stop_outbox_workers()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ehlo-delay", type=float, default=0, help="milliseconds")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(engine)
+    handler = CountingHandler(args.ehlo_delay / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=PORT)
+    controller.start()
+    try:
+        print(f"{args.messages} messages, {args.workers} concurrent senders")
+        print(f"{'path':<30}{'msgs/s':>10}{'connects':>10}")
+        for name, run in (
+            ("connection per message", connection_per_message),
+            ("reused connections", reused_connections),
+            ("outbox table + workers", None),
+        ):
+            connects = app_email._stats["connects_total"]
+            start = time.perf_counter()
+            if run is None:
+                await through_outbox(args.messages, args.workers, handler)
+            else:
+                await run(args.messages, args.workers)
+            elapsed = time.perf_counter() - start
+            connects = (
+                args.messages
+                if run is connection_per_message
+                else app_email._stats["connects_total"] - connects
+            )
+            print(f"{name:<30}{args.messages / elapsed:>10.0f}{connects:>10}")
+    finally:
+        controller.stop()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
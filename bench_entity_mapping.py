@@ -0,0 +1,151 @@
+"""
+Microbenchmark for building Application entities on list endpoints.
+
+Compares the previous read path (ORM instances copied into a plain
+__dict__-based entity) with the current one (Core rows passed positionally
+to the slotted entity via app.repositories.mappers), on an in-memory SQLite
+database so the numbers are dominated by Python-side object construction.
+
+    python bench_entity_mapping.py --rows 5000 --repeat 20
+"""
+import argparse
+import os
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+# Only the models and mappers are needed; let the app import without a .env.
+# The app's engines are created but never connected to.
+os.environ.setdefault("DATABASE_URL", "sqlite:///bench.db")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+os.environ.setdefault("MAIL_USERNAME", "bench")
+os.environ.setdefault("MAIL_PASSWORD", "bench")
+os.environ.setdefault("MAIL_FROM", "bench@example.com")
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from app.core.database import Base
+from app.models.application import Application as ApplicationModel
+from app.models.application_cycle import ApplicationCycle as ApplicationCycleModel
+from app.models.user import User as UserModel
+from app.models.role import Role as RoleModel
+from app.repositories.mappers import APPLICATION
+
+
+class DictApplication:
+    """The entity as it was before slots: a plain class with an __init__."""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+def seed(engine, rows: int):
+    now = datetime.now(timezone.utc)
+    with Session(engine) as db:
+        db.add(RoleModel(id=1, name="applicant"))
+        db.add(
+            ApplicationCycleModel(
+                id=1,
+                name="bench",
+                start_date=now.date(),
+                end_date=now.date(),
+                is_active=True,
+            )
+        )
+        users = [
+            UserModel(
+                id=uuid.uuid4(),
+                email=f"bench{i}@example.com",
+                password="x",
+                full_name=f"Applicant {i}",
+                role_id=1,
+            )
+            for i in range(rows)
+        ]
+        db.add_all(users)
+        db.flush()
+        db.add_all(
+            ApplicationModel(
+                applicant_id=user.id,
+                cycle_id=1,
+                status="pending_review",
+                school="School",
+                student_id=str(i),
+                country="Ethiopia",
+                degree="BSc",
+                leetcode_handle="lc",
+                codeforces_handle="cf",
+                essay_why_a2sv="why " * 100,
+                essay_about_you="about " * 100,
+                resume_url="https://example.com/resume.pdf",
+                submitted_at=now,
+            )
+            for i, user in enumerate(users)
+        )
+        db.commit()
+
+
+def orm_copy(engine):
+    with Session(engine) as db:
+        return [
+            DictApplication(**{name: getattr(app, name) for name in APPLICATION.fields})
+            for app in db.execute(select(ApplicationModel)).scalars().all()
+        ]
+
+
+def orm_mapper(engine):
+    with Session(engine) as db:
+        return [
+            APPLICATION.from_object(app)
+            for app in db.execute(select(ApplicationModel)).scalars().all()
+        ]
+
+
+def core_rows(engine):
+    with engine.connect() as conn:
+        return [
+            APPLICATION.from_row(row)
+            for row in conn.execute(select(*APPLICATION.columns)).all()
+        ]
+
+
+def measure(fn, engine, repeat: int):
+    fn(engine)  # warm up statement caches
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(engine)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = fn(engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    seed(engine, args.rows)
+
+    print(f"{'path':<28}{'best ms':>10}{'peak KiB':>12}{'rows':>8}")
+    for name, fn in (
+        ("ORM + dict entity (before)", orm_copy),
+        ("ORM + slotted entity", orm_mapper),
+        ("Core rows + slotted entity", core_rows),
+    ):
+        best, peak, count = measure(fn, engine, args.repeat)
+        print(f"{name:<28}{best * 1000:>10.1f}{peak / 1024:>12.0f}{count:>8}")
+
+
+if __name__ == "__main__":
+    main()
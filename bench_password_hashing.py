@@ -0,0 +1,106 @@
+"""
+Benchmark for password verification, the step that dominates POST /auth/token/.
+
+Runs the same number of concurrent logins' worth of bcrypt verifications
+through the previous path (Starlette's threadpool) and through the password
+hashing process pool at increasing worker counts, then floods a small pool
+to show requests beyond PASSWORD_HASH_QUEUE_LIMIT being turned away with 503.
+
+    python bench_password_hashing.py --logins 64 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# Only app.core.security is needed; let the app import without a .env.
+os.environ.setdefault("DATABASE_URL", "sqlite:///bench.db")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+os.environ.setdefault("MAIL_USERNAME", "bench")
+os.environ.setdefault("MAIL_PASSWORD", "bench")
+os.environ.setdefault("MAIL_FROM", "bench@example.com")
+
+from starlette.concurrency import run_in_threadpool
+from app.core import security
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+
+PASSWORD = "correct horse battery staple"
+
+
+async def threadpool_verify(hashed: str) -> bool:
+    return await run_in_threadpool(security.verify_password, PASSWORD, hashed)
+
+
+async def pool_verify(hashed: str) -> bool:
+    return await security.verify_password_async(PASSWORD, hashed)
+
+
+async def run(verify, hashed: str, logins: int, concurrency: int):
+    gate = asyncio.Semaphore(concurrency)
+    latencies, rejected = [], 0
+
+    async def login():
+        nonlocal rejected
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await verify(hashed)
+            except ServiceUnavailableError:
+                rejected += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    return elapsed, latencies, rejected
+
+
+def report(name: str, logins: int, elapsed: float, latencies, rejected: int):
+    if latencies:
+        p50 = statistics.median(latencies) * 1000
+        p95 = max(latencies) * 1000
+        if len(latencies) > 1:
+            p95 = statistics.quantiles(latencies, n=20)[-1] * 1000
+    else:
+        p50 = p95 = 0.0
+    ok = logins - rejected
+    print(f"{name:<22}{ok / elapsed:>10.1f}{p50:>10.0f}{p95:>10.0f}{rejected:>10}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    hashed = security.hash_password(PASSWORD)
+    cores = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    # Measure throughput, not load shedding
+    settings.PASSWORD_HASH_QUEUE_LIMIT = args.logins
+
+    print(f"{cores} CPUs, {args.logins} logins, {args.concurrency} at a time")
+    print(f"{'path':<22}{'logins/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'rejected':>10}")
+    result = await run(threadpool_verify, hashed, args.logins, args.concurrency)
+    report("threadpool (before)", args.logins, *result)
+    for count in workers:
+        settings.PASSWORD_HASH_WORKERS = count
+        security.shutdown_hash_pool()
+        await pool_verify(hashed)  # start the worker processes
+        result = await run(pool_verify, hashed, args.logins, args.concurrency)
+        report(f"process pool x{count}", args.logins, *result)
+
+    settings.PASSWORD_HASH_WORKERS = 1
+    settings.PASSWORD_HASH_QUEUE_LIMIT = 2
+    security.shutdown_hash_pool()
+    await pool_verify(hashed)
+    result = await run(pool_verify, hashed, args.logins, args.concurrency)
+    report("x1, queue limit 2", args.logins, *result)
+    security.shutdown_hash_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -23,7 +23,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from app.core.database import Base
 
 # Import your models so Alembic knows about them
-from app.models import user, role, application, application_cycle, review
+from app.models import user, role, application, application_cycle, review, application_stat, token_version, email_outbox
 
 target_metadata = Base.metadata
 
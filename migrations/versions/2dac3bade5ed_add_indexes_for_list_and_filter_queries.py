@@ -0,0 +1,52 @@
+"""Add indexes for list and filter queries
+
+Revision ID: 2dac3bade5ed
+Revises: 9f58b69686da
+Create Date: 2026-10-17 09:12:41.204318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2dac3bade5ed'
+down_revision: Union[str, Sequence[str], None] = '9f58b69686da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_applications_cycle_status_submitted', 'applications', ['cycle_id', 'status', 'submitted_at', 'id']),
+    ('ix_applications_cycle_submitted', 'applications', ['cycle_id', 'submitted_at', 'id']),
+    ('ix_applications_reviewer_submitted', 'applications', ['assigned_reviewer_id', 'submitted_at', 'id']),
+    ('ix_applications_applicant_id', 'applications', ['applicant_id']),
+    ('ix_users_role_created', 'users', ['role_id', 'created_at', 'id']),
+    ('ix_users_created', 'users', ['created_at', 'id']),
+    ('ix_application_cycles_created', 'application_cycles', ['created_at', 'id']),
+    ('ix_reviews_reviewer_id', 'reviews', ['reviewer_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, but it keeps the tables
+    # writable while the indexes build.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,42 @@
+"""Add application_stats counters table
+
+Revision ID: aab307589b28
+Revises: 2dac3bade5ed
+Create Date: 2026-10-17 10:41:07.553190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aab307589b28'
+down_revision: Union[str, Sequence[str], None] = '2dac3bade5ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_stats',
+    sa.Column('cycle_id', sa.Integer(), nullable=False),
+    sa.Column('dimension', sa.String(length=20), nullable=False),
+    sa.Column('bucket', sa.String(length=255), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['cycle_id'], ['application_cycles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('cycle_id', 'dimension', 'bucket')
+    )
+    # Backfill from the existing applications
+    for dimension in ('status', 'school', 'country'):
+        op.execute(
+            f"INSERT INTO application_stats (cycle_id, dimension, bucket, count) "
+            f"SELECT cycle_id, '{dimension}', {dimension}, COUNT(*) "
+            f"FROM applications GROUP BY cycle_id, {dimension}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('application_stats')
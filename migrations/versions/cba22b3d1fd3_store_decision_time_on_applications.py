@@ -0,0 +1,44 @@
+"""Store decision time and review duration on applications
+
+Revision ID: cba22b3d1fd3
+Revises: aab307589b28
+Create Date: 2026-10-17 12:05:19.842177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cba22b3d1fd3'
+down_revision: Union[str, Sequence[str], None] = 'aab307589b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('decided_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('applications', sa.Column('review_duration_seconds', sa.Integer(), nullable=True))
+    op.create_index('ix_applications_cycle_review_duration', 'applications', ['cycle_id', 'review_duration_seconds'], unique=False)
+    # Until now the last update of a decided application was its decision
+    if op.get_bind().dialect.name == "postgresql":
+        elapsed = "EXTRACT(EPOCH FROM updated_at - submitted_at)"
+    else:
+        elapsed = "(julianday(updated_at) - julianday(submitted_at)) * 86400"
+    op.execute(
+        "UPDATE applications "
+        "SET decided_at = updated_at, "
+        f"review_duration_seconds = CASE WHEN {elapsed} < 0 THEN 0 "
+        f"ELSE CAST(FLOOR({elapsed}) AS INTEGER) END "
+        "WHERE status IN ('accepted', 'rejected') AND submitted_at IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_applications_cycle_review_duration', table_name='applications')
+    op.drop_column('applications', 'review_duration_seconds')
+    op.drop_column('applications', 'decided_at')
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+from sqlalchemy import text
+from app.core.database import AsyncSessionLocal, async_engine
+from app.repositories.async_impl import ApplicationStatRepository
+
+
+async def reconcile_application_stats(dry_run: bool = False):
+    """
+    Recounts application_stats from the applications table, prints every
+    counter that has drifted and, unless dry_run is set, rewrites the table.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            if db.bind.dialect.name == "postgresql":
+                # Hold off application writes so the recount and the rewrite
+                # see the same rows
+                await db.execute(text("LOCK TABLE applications IN SHARE MODE"))
+
+            repo = ApplicationStatRepository(db)
+            stored = await repo.get_all()
+            expected = await repo.recount()
+
+            drift = 0
+            for key in sorted(set(stored) | set(expected), key=str):
+                have, want = stored.get(key, 0), expected.get(key, 0)
+                if have != want:
+                    drift += 1
+                    cycle_id, dimension, bucket = key
+                    print(
+                        f"cycle={cycle_id} {dimension}={bucket!r}: "
+                        f"stored {have}, actual {want}"
+                    )
+            if not drift:
+                print("application_stats is in sync.")
+            else:
+                print(f"{drift} counter(s) drifted.")
+
+            if dry_run:
+                await db.rollback()
+                return drift
+
+            await repo.replace_all(expected)
+            await db.commit()
+            print(f"application_stats rebuilt with {len(expected)} counter(s).")
+            return drift
+        except Exception as e:
+            print(f"Error reconciling application_stats: {e}")
+            await db.rollback()
+            raise
+
+
+async def main(dry_run: bool):
+    try:
+        await reconcile_application_stats(dry_run=dry_run)
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the application_stats counters and report drift."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only report drift, don't rewrite."
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
@@ -0,0 +1,189 @@
+import os
+import tempfile
+
+# Settings are read once, when app.core.config is imported, so the test
+# database has to be chosen first. The suite runs on a throwaway SQLite file
+# unless TEST_DATABASE_URL names a (disposable) Postgres database.
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or (
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+)
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+os.environ.setdefault("MAIL_USERNAME", "test")
+os.environ.setdefault("MAIL_PASSWORD", "test")
+os.environ.setdefault("MAIL_FROM", "test@example.com")
+
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, async_engine, engine
+from app.core.security import create_user_access_token
+from app.main import app
+from app.models.application import Application
+from app.models.application_cycle import ApplicationCycle
+from app.models.application_stat import ApplicationStat
+from app.models.review import Review
+from app.models.role import Role
+from app.models.user import User
+
+APPLICANTS = 40
+
+
+@dataclass
+class Seeded:
+    cycle_id: int
+    manager: User
+    reviewer: User
+    applicants: List[User]
+    application_ids: List[uuid.UUID]
+
+
+def _user(email: str, role_id: int) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=email,
+        password="not-a-hash",
+        full_name=email.split("@")[0].title(),
+        role_id=role_id,
+        is_active=1,
+    )
+
+
+def _application(applicant: User, cycle_id: int, **values) -> Application:
+    return Application(
+        **{
+            "id": uuid.uuid4(),
+            "applicant_id": applicant.id,
+            "cycle_id": cycle_id,
+            "school": "School 0",
+            "student_id": "0",
+            "country": "Country 0",
+            "degree": "BSc",
+            "leetcode_handle": "lc",
+            "codeforces_handle": "cf",
+            "essay_why_a2sv": "why",
+            "essay_about_you": "about",
+            "resume_url": "https://example.com/resume.pdf",
+            **values,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def seeded() -> Seeded:
+    """One active cycle with a manager, a reviewer and APPLICANTS submitted applications."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as db:
+        db.add_all(
+            Role(id=i, name=name)
+            for i, name in enumerate(["applicant", "reviewer", "manager", "admin"], 1)
+        )
+        cycle = ApplicationCycle(
+            id=1,
+            name="2026",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 12, 31),
+            is_active=True,
+        )
+        manager = _user("manager@example.com", 3)
+        reviewer = _user("reviewer@example.com", 2)
+        applicants = [_user(f"applicant{i}@example.com", 1) for i in range(APPLICANTS)]
+        db.add_all([cycle, manager, reviewer, *applicants])
+        db.flush()
+        applications = [
+            _application(
+                applicant,
+                cycle.id,
+                status="pending_review",
+                school=f"School {i % 3}",
+                student_id=str(i),
+                country=f"Country {i % 4}",
+                assigned_reviewer_id=reviewer.id,
+                submitted_at=datetime(2026, 2, 1) + timedelta(hours=i),
+            )
+            for i, applicant in enumerate(applicants)
+        ]
+        db.add_all(applications)
+        db.flush()
+        db.add_all(
+            Review(application_id=a.id, reviewer_id=reviewer.id, resume_score=3)
+            for a in applications[::2]
+        )
+        db.commit()
+    return Seeded(
+        cycle_id=cycle.id,
+        manager=manager,
+        reviewer=reviewer,
+        applicants=applicants,
+        application_ids=[a.id for a in applications],
+    )
+
+
+@pytest.fixture
+def add_application(seeded):
+    """
+    Adds applications to the seeded cycle for one test. They are deleted
+    afterwards, along with the counters the API kept for them, so the next
+    test sees the seed as it was.
+    """
+    added = []
+
+    def add(applicant: User, status: str, **values) -> Application:
+        with Session(engine, expire_on_commit=False) as db:
+            application = _application(applicant, seeded.cycle_id, status=status, **values)
+            db.add(application)
+            db.commit()
+        added.append(application.id)
+        return application
+
+    yield add
+    with Session(engine) as db:
+        db.execute(delete(Application).where(Application.id.in_(added)))
+        # The seed is written without counters
+        db.execute(delete(ApplicationStat).where(ApplicationStat.cycle_id == seeded.cycle_id))
+        db.commit()
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    # Not entered as a context manager, so the app's lifespan doesn't run
+    # and only the requests' own queries are seen
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers():
+    def headers(user: User, role: str, token_version: int = 0) -> dict:
+        token = create_user_access_token(user, role, token_version)
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers
+
+
+@contextmanager
+def _recording_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def count_queries():
+    """Collects the SQL statements the API's engine sends inside a `with` block."""
+    return _recording_queries
@@ -0,0 +1,54 @@
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.models.token_version import TokenVersion
+from app.models.user import User
+
+
+def _reviewer(db: Session) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email=f"{uuid.uuid4().hex}@example.com",
+        password="not-a-hash",
+        full_name="Reviewer",
+        role_id=2,
+        is_active=1,
+    )
+    db.add(user)
+    return user
+
+
+def test_newer_token_version_is_accepted_by_a_stale_worker(
+    client, seeded, auth_headers
+):
+    with Session(engine, expire_on_commit=False) as db:
+        user = _reviewer(db)
+        db.commit()
+    old_headers = auth_headers(user, "reviewer", 0)
+    # This worker loads the version table while the user is still at 0
+    assert client.get("/reviews/assigned/", headers=old_headers).status_code == 200
+
+    # Another worker changes the user's role and logs them in again
+    with Session(engine) as db:
+        db.add(TokenVersion(user_id=user.id, version=1))
+        db.commit()
+    new_headers = auth_headers(user, "reviewer", 1)
+
+    assert client.get("/reviews/assigned/", headers=new_headers).status_code == 200
+    # Having seen version 1, this worker no longer takes the revoked token
+    assert client.get("/reviews/assigned/", headers=old_headers).status_code == 401
+
+
+def test_inactive_user_is_refused_with_either_kind_of_token(client, seeded, auth_headers):
+    with Session(engine, expire_on_commit=False) as db:
+        user = _reviewer(db)
+        user.is_active = 0
+        db.commit()
+    legacy = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    for headers in (auth_headers(user, "reviewer"), legacy):
+        response = client.get("/reviews/assigned/", headers=headers)
+        assert response.status_code == 403
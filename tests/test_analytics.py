@@ -0,0 +1,28 @@
+import asyncio
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.async_impl import ApplicationRepository
+
+
+async def _review_time_stats(cycle_id: int):
+    async with AsyncSessionLocal() as db:
+        return await ApplicationRepository(db).get_review_time_stats(cycle_id)
+
+
+def test_review_time_stats_in_one_statement(seeded, add_application, count_queries):
+    for i, seconds in enumerate([40, 10, 30, 20, 100, 60, 50, 90, 80, 70]):
+        add_application(seeded.applicants[i], "accepted", review_duration_seconds=seconds)
+    # Undecided applications don't count, whatever they hold
+    add_application(seeded.applicants[10], "pending_review", review_duration_seconds=1)
+
+    with count_queries() as statements:
+        average, percentiles = asyncio.run(_review_time_stats(seeded.cycle_id))
+
+    assert len(statements) == 1
+    # Nearest rank: p50 is the 5th of 10 sorted durations, p90 the 9th, p99 the 10th
+    assert average == 55.0
+    assert percentiles == {"p50": 50.0, "p90": 90.0, "p99": 100.0}
+
+
+def test_review_time_stats_without_decisions(seeded):
+    assert asyncio.run(_review_time_stats(seeded.cycle_id)) == (None, {})
@@ -0,0 +1,56 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import email as outbox
+from app.core.config import settings
+from app.core.database import engine
+from app.models.email_outbox import EmailOutbox
+
+
+class HangingSender:
+    """An SMTP server that accepts the connection and then never answers."""
+
+    def __init__(self):
+        self.attempts = 0
+
+    async def send(self, recipient: str, subject: str, html_body: str):
+        self.attempts += 1
+        await asyncio.Event().wait()
+
+
+def test_claimed_batch_is_sent_within_its_lease(seeded, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_SEND_TIMEOUT", 1)
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_LEASE", 3)
+    with Session(engine) as db:
+        db.add_all(
+            EmailOutbox(
+                recipient=f"hang{i}@example.com",
+                subject="Hello",
+                html_body="<p>Hello</p>",
+                status="pending",
+                attempts=0,
+                next_attempt_at=datetime.now(timezone.utc),
+            )
+            for i in range(4)
+        )
+        db.commit()
+
+    sender = HangingSender()
+    started = time.monotonic()
+    claimed = asyncio.run(outbox.deliver_due(sender, 20))
+    elapsed = time.monotonic() - started
+
+    # Two one-second sends, with one second of the lease to spare
+    assert claimed == sender.attempts == 2
+    assert elapsed < settings.EMAIL_OUTBOX_LEASE
+    with Session(engine) as db:
+        emails = db.scalars(
+            select(EmailOutbox).where(EmailOutbox.recipient.like("hang%"))
+        ).all()
+    failed = [e for e in emails if e.attempts]
+    assert len(failed) == 2
+    assert all(e.status == "pending" and "TimeoutError" in e.last_error for e in failed)
@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.models.application import Application
+
+
+def test_list_applications_query_count_does_not_depend_on_page_size(
+    client, seeded, auth_headers, count_queries
+):
+    headers = auth_headers(seeded.manager, "manager")
+    # The first request pays for one-off loads; measure the ones after it
+    assert client.get("/manager/applications/?limit=1", headers=headers).status_code == 200
+
+    counts = {}
+    for limit in (5, 30):
+        with count_queries() as statements:
+            response = client.get(f"/manager/applications/?limit={limit}", headers=headers)
+        assert response.status_code == 200
+        applications = response.json()["data"]["applications"]
+        assert len(applications) == limit
+        assert all(a["applicant_name"] and a["assigned_reviewer_name"] for a in applications)
+        counts[limit] = len(statements)
+
+    assert counts[5] == counts[30]
+
+
+def test_auto_assign_leaves_drafts_with_the_applicant(
+    client, seeded, auth_headers, add_application
+):
+    draft = add_application(seeded.applicants[0], "in_progress")
+    submitted = add_application(seeded.applicants[1], "submitted")
+
+    response = client.post(
+        "/manager/applications/auto-assign/",
+        json={"cycle_id": seeded.cycle_id, "reviewer_ids": [str(seeded.reviewer.id)]},
+        headers=auth_headers(seeded.manager, "manager"),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["assigned_count"] == 1
+    with Session(engine) as db:
+        draft = db.get(Application, draft.id)
+        assert (draft.status, draft.assigned_reviewer_id) == ("in_progress", None)
+        submitted = db.get(Application, submitted.id)
+        assert (submitted.status, submitted.assigned_reviewer_id) == (
+            "pending_review",
+            seeded.reviewer.id,
+        )
+
+
+def test_bulk_decide_by_ids_only_decides_submitted_applications(
+    client, seeded, auth_headers, add_application
+):
+    decided_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    accepted = add_application(
+        seeded.applicants[0], "accepted", decided_at=decided_at, review_duration_seconds=60
+    )
+    draft = add_application(seeded.applicants[1], "in_progress")
+    submitted = add_application(seeded.applicants[2], "pending_review")
+    missing = uuid.uuid4()
+
+    response = client.post(
+        "/manager/applications/bulk-decide/",
+        json={
+            "status": "rejected",
+            "application_ids": [str(a) for a in (accepted.id, draft.id, submitted.id, missing)],
+        },
+        headers=auth_headers(seeded.manager, "manager"),
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["decided_count"] == 1
+    assert [(r["result"], r["previous_status"]) for r in data["results"]] == [
+        ("already_decided", "accepted"),
+        ("not_eligible", "in_progress"),
+        ("decided", "pending_review"),
+        ("not_found", None),
+    ]
+    with Session(engine) as db:
+        accepted = db.get(Application, accepted.id)
+        assert (accepted.status, accepted.review_duration_seconds) == ("accepted", 60)
+        assert accepted.decided_at.replace(tzinfo=timezone.utc) == decided_at
+        assert db.get(Application, draft.id).status == "in_progress"
+        assert db.get(Application, submitted.id).status == "rejected"
+
+
+def test_bulk_decide_refuses_ids_with_a_cycle_or_cut_off(client, seeded, auth_headers):
+    ids = [str(seeded.application_ids[0])]
+    for extra in ({"cycle_id": seeded.cycle_id}, {"min_score": 10}):
+        response = client.post(
+            "/manager/applications/bulk-decide/",
+            json={"status": "accepted", "application_ids": ids, **extra},
+            headers=auth_headers(seeded.manager, "manager"),
+        )
+        assert response.status_code == 400
+    with Session(engine) as db:
+        assert db.get(Application, seeded.application_ids[0]).status == "pending_review"
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import null
+
+DRAFTS = 5
+
+
+@pytest.fixture
+def drafts(seeded, add_application):
+    # In-progress drafts have no submitted_at, the end of the keyset order.
+    # null() rather than None, which would leave the column to its default
+    return [
+        add_application(
+            applicant,
+            "in_progress",
+            submitted_at=null(),
+            assigned_reviewer_id=seeded.reviewer.id,
+        )
+        for applicant in seeded.applicants[:DRAFTS]
+    ]
+
+
+def _walk(client, url, headers, items_key, id_key):
+    """Follows next_cursor from the first page and returns (ids seen, total_count)."""
+    data = client.get(url, headers=headers).json()["data"]
+    seen = [item[id_key] for item in data[items_key]]
+    while data["next_cursor"]:
+        response = client.get(f"{url}&cursor={data['next_cursor']}", headers=headers)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen += [item[id_key] for item in data[items_key]]
+    return seen, data["total_count"]
+
+
+@pytest.mark.parametrize("limit", [7, 9, 45])
+def test_cursor_walk_of_manager_list_includes_drafts(
+    client, seeded, auth_headers, drafts, limit
+):
+    seen, total_count = _walk(
+        client,
+        f"/manager/applications/?limit={limit}",
+        auth_headers(seeded.manager, "manager"),
+        "applications",
+        "id",
+    )
+
+    assert total_count == len(seeded.application_ids) + DRAFTS
+    assert len(seen) == len(set(seen)) == total_count
+    # Submitted applications first, then the drafts
+    assert set(seen[-DRAFTS:]) == {str(draft.id) for draft in drafts}
+
+
+def test_cursor_walk_of_reviewer_list_includes_drafts(
+    client, seeded, auth_headers, drafts
+):
+    seen, total_count = _walk(
+        client,
+        "/reviews/assigned/?limit=7",
+        auth_headers(seeded.reviewer, "reviewer"),
+        "reviews",
+        "application_id",
+    )
+
+    assert total_count == len(seeded.application_ids) + DRAFTS
+    assert len(seen) == len(set(seen)) == total_count
+    assert set(seen[-DRAFTS:]) == {str(draft.id) for draft in drafts}
@@ -0,0 +1,134 @@
+"""
+The hot repository queries must be answerable from an index. Each query is
+run against the seeded database to capture the SQL it sends, then that SQL
+is EXPLAINed and the test fails if any table is read with a sequential scan.
+"""
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import get_async_database_url
+from app.repositories.async_impl import (
+    ApplicationCycleRepository,
+    ApplicationRepository,
+    ReviewRepository,
+    UserRepository,
+)
+
+QUERIES = {
+    "manager list": lambda db, s: ApplicationRepository(db).list_summaries(
+        s.cycle_id, limit=10
+    ),
+    "manager list by status": lambda db, s: ApplicationRepository(db).list_summaries(
+        s.cycle_id, status="pending_review", limit=10
+    ),
+    "manager list, next page": lambda db, s: ApplicationRepository(
+        db
+    ).list_summaries_after(
+        s.cycle_id, (datetime(2026, 2, 1), s.application_ids[0]), 10, status="pending_review"
+    ),
+    "manager list, next page of drafts": lambda db, s: ApplicationRepository(
+        db
+    ).list_summaries_after(s.cycle_id, (None, s.application_ids[0]), 10),
+    "reviewer list, next page": lambda db, s: ApplicationRepository(
+        db
+    ).list_summaries_by_reviewer_after(
+        s.reviewer.id, (datetime(2026, 2, 1), s.application_ids[0]), 10
+    ),
+    "manager count": lambda db, s: ApplicationRepository(db).count_by_cycle(
+        s.cycle_id, status="pending_review"
+    ),
+    "reviewer list": lambda db, s: ApplicationRepository(
+        db
+    ).list_summaries_by_reviewer(s.reviewer.id, limit=10),
+    "reviewer count": lambda db, s: ApplicationRepository(db).count_by_reviewer(
+        s.reviewer.id
+    ),
+    "applicant's application": lambda db, s: ApplicationRepository(
+        db
+    ).get_summary_by_applicant(s.applicants[0].id),
+    "review time stats": lambda db, s: ApplicationRepository(db).get_review_time_stats(
+        s.cycle_id
+    ),
+    "users by role": lambda db, s: UserRepository(db).list_by_role(2, limit=10),
+    "users by role count": lambda db, s: UserRepository(db).count_by_role(2),
+    "users, next page": lambda db, s: UserRepository(db).list_after(
+        (datetime(2026, 1, 1), s.manager.id), 10
+    ),
+    "cycles, next page": lambda db, s: ApplicationCycleRepository(db).list_after(
+        (datetime(2026, 1, 1), 1), 10
+    ),
+    "reviewer's reviews": lambda db, s: ReviewRepository(db).list_by_reviewer(
+        s.reviewer.id
+    ),
+}
+
+
+def _sqlite_scans(rows):
+    # EXPLAIN QUERY PLAN says SEARCH for a lookup on an index and SCAN for
+    # reading all of a table, or all of an index, which is no better here
+    return [
+        detail
+        for *_, detail in rows
+        if detail.startswith("SCAN ") and detail != "SCAN CONSTANT ROW"
+    ]
+
+
+def _postgres_scans(rows):
+    def walk(node):
+        if node["Node Type"] == "Seq Scan":
+            yield f"Seq Scan on {node['Relation Name']}"
+        for child in node.get("Plans", []):
+            yield from walk(child)
+
+    plan = rows[0][0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return list(walk(plan[0]["Plan"]))
+
+
+async def _sequential_scans(run, seeded):
+    engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_URL), poolclass=NullPool
+    )
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    try:
+        async with engine.connect() as conn:
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+            try:
+                async with AsyncSession(bind=conn) as db:
+                    await run(db, seeded)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+            if conn.dialect.name == "postgresql":
+                # On a table this small a sequential scan is always cheapest;
+                # only fall back to one when no index can answer the query
+                await conn.exec_driver_sql("SET enable_seqscan = off")
+                prefix, scans = "EXPLAIN (FORMAT JSON) ", _postgres_scans
+            else:
+                prefix, scans = "EXPLAIN QUERY PLAN ", _sqlite_scans
+            found = []
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(prefix + statement, parameters)
+                found += [(scan, statement) for scan in scans(result.all())]
+            return statements, found
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("run", QUERIES.values(), ids=QUERIES.keys())
+def test_repository_query_does_not_scan_a_whole_table(seeded, run):
+    statements, scans = asyncio.run(_sequential_scans(run, seeded))
+    assert statements, "the repository method sent no SQL"
+    assert not scans, "\n\n".join(f"{scan}:\n{statement}" for scan, statement in scans)